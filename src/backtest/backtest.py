@@ -1,7 +1,11 @@
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
-from .metrics import Metrics
-from .plotting import Plotter
+from .sparse_signal import SparseSignal
+from .trades import TradeLedger
+from ..metrics import Metrics
+from ..plotting import Plotter
 
 
 class Backtester:
@@ -22,6 +26,7 @@ class Backtester:
         initial_capital: float = 100_000,
         commission: float = 0.0,
         slippage: float = 0.0,
+        cache=None,
     ):
         """
         Parameters:
@@ -30,15 +35,46 @@ class Backtester:
             initial_capital (float): Starting portfolio value.
             commission (float): Cost per trade.
             slippage (float): Price adjustment for fills.
+            cache (ResultCache): Optional on-disk cache for run() / get_metrics().
         """
         self.data_path = data_path
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.commission = commission
         self.slippage = slippage
+        self.cache = cache
 
+        self._appended = []
         self.data = None
         self.results = None
+        self._cache_key = None
+
+    # Distinct position sizes whose log-growth prefix is kept by run_sparse()
+    LOG_GROWTH_ENTRIES = 16
+
+    @property
+    def data(self):
+        if self._appended and self._results is self._data:
+            self._flush_appended()
+        return self._data
+
+    @data.setter
+    def data(self, df):
+        # Prefixes derived from the previous frame are stale
+        self._data = df
+        self._log_growth = OrderedDict()
+
+    @property
+    def results(self):
+        if self._appended:
+            self._flush_appended()
+        return self._results
+
+    @results.setter
+    def results(self, df):
+        self._results = df
+        self._appended = []
+        self._append_state = None
 
     # ---------------------------------------------------------
     # Load Data
@@ -60,12 +96,40 @@ class Backtester:
     # ---------------------------------------------------------
     # Execute Strategy
     # ---------------------------------------------------------
-    def run(self):
-        """Run the trading strategy and compute equity curve."""
+    def run(self, compact: bool = False, float32: bool = False):
+        """
+        Run the trading strategy and compute equity curve.
+
+        Parameters:
+            compact (bool): Return a slim, typed result frame (see
+                run_compact()) instead of appending six float64 columns
+                to self.data.
+            float32 (bool): In compact mode, store returns and costs as float32.
+        """
+
+        if self.cache is not None and self.data_path is not None:
+            self._cache_key = self.cache.key(self, compact=compact, float32=float32)
+            cached = self.cache.get_results(self._cache_key) if self._cache_key else None
+            if cached is not None:
+                self.results = cached
+                return self.results
 
         if self.data is None:
             self.load_data()
 
+        if compact:
+            self.run_compact(float32=float32)
+        else:
+            self._run_full()
+
+        if self._cache_key is not None:
+            self.cache.put_results(self._cache_key, self.results)
+
+        return self.results
+
+    def _run_full(self):
+        """Append the full set of result columns to self.data."""
+
         # Strategy should return a vector of positions (+1, -1, 0)
         self.data["Signal"] = self.strategy.generate_signals(self.data)
 
@@ -75,8 +139,7 @@ class Backtester:
         # PnL = position * next_day_return
         self.data["Strategy_Returns"] = (
             self.data["Signal"].shift(1) * self.data["Returns"]
-        )
-        self.data["Strategy_Returns"].fillna(0, inplace=True)
+        ).fillna(0)
 
         # Transaction cost model
         self.data["Trade"] = self.data["Signal"].diff().abs()
@@ -94,8 +157,400 @@ class Backtester:
         # Save results
         self.results = self.data
 
+    def run_compact(self, float32: bool = False):
+        """
+        Run the strategy and keep only the non-redundant result columns.
+
+        Signal is stored as int8 (warm-up rows as flat), Net_Returns and
+        Transaction_Cost as float64 or float32, and Equity as float64.
+        Strategy_Returns, Trade and Returns are dropped since they can be
+        rebuilt from the rest; self.data is left untouched.
+        """
+        if self.data is None:
+            self.load_data()
+
+        signal = (
+            pd.Series(self.strategy.generate_signals(self.data))
+            .reindex(self.data.index)
+            .to_numpy(dtype=np.float64)
+        )
+        res = self.run_batch(signal)
+        value_dtype = np.float32 if float32 else np.float64
+
+        out = pd.DataFrame(index=self.data.index)
+        if "Date" in self.data.columns:
+            out["Date"] = self.data["Date"]
+        out["Close"] = self.data["Close"]
+        out["Signal"] = np.nan_to_num(signal).astype(np.int8)
+        out["Transaction_Cost"] = res["Transaction_Cost"][:, 0].astype(value_dtype)
+        out["Net_Returns"] = res["Net_Returns"][:, 0].astype(value_dtype)
+        out["Equity"] = res["Equity"][:, 0]
+
+        self.results = out
         return self.results
 
+    # ---------------------------------------------------------
+    # Batch Execution (many strategies, one price series)
+    # ---------------------------------------------------------
+    def run_batch(self, signals, dtype=np.float64):
+        """
+        Run many signal vectors against the loaded prices in one pass.
+
+        Applies the same PnL and cost model as run(), broadcast across
+        the columns of a (bars x configurations) signal matrix. Nothing
+        is written to self.data, so a parameter sweep costs a handful of
+        array operations instead of one DataFrame mutation per config.
+
+        Parameters:
+            signals (array-like): 2D positions aligned with self.data rows,
+                one column per configuration (NaN during indicator warm-up).
+                A 1D vector is treated as a single column.
+            dtype: Float dtype of the output arrays (np.float32 halves memory).
+
+        Returns:
+            dict: "Net_Returns", "Transaction_Cost" and "Equity" as
+                (bars x configurations) NumPy arrays. Rows where run()
+                would produce NaN (no prior signal to diff against) are NaN
+                here too, so Metrics over a column matches get_metrics().
+        """
+        if self.data is None:
+            self.load_data()
+
+        sig = np.asarray(signals, dtype=dtype)
+        if sig.ndim == 1:
+            sig = sig[:, None]
+        if sig.ndim != 2 or sig.shape[0] != len(self.data):
+            raise ValueError(
+                f"signals must have shape ({len(self.data)}, n_configs), got {sig.shape}"
+            )
+
+        returns = self.data["Returns"].to_numpy(dtype=dtype)
+
+        # PnL = position * next_day_return (flat before the first signal)
+        net = np.zeros_like(sig)
+        np.multiply(sig[:-1], returns[1:, None], out=net[1:])
+        np.nan_to_num(net, copy=False)
+
+        # Transaction cost model
+        cost = np.abs(np.diff(sig, axis=0, prepend=np.nan))
+        cost *= self.commission
+        net -= cost
+
+        # Equity Curve (NaN rows are skipped, as in Series.cumprod)
+        missing = np.isnan(net)
+        equity = net + 1
+        equity[missing] = 1
+        np.cumprod(equity, axis=0, out=equity)
+        equity *= self.initial_capital
+        equity[missing] = np.nan
+
+        return {
+            "Net_Returns": net,
+            "Transaction_Cost": cost,
+            "Equity": equity,
+        }
+
+    # ---------------------------------------------------------
+    # Sparse (Change-Point) Signals
+    # ---------------------------------------------------------
+    def _run_log_growth(self, value: float, returns: np.ndarray):
+        """
+        Prefix sums of log(1 + value * Returns), computed once per distinct
+        position size and reused by every sparse signal over this data;
+        None if a bar would wipe out the position (log undefined).
+
+        The cache is dropped whenever self.data is replaced and keeps the
+        LOG_GROWTH_ENTRIES most recently used position sizes.
+        """
+        key = (float(value), len(returns))
+        if key in self._log_growth:
+            self._log_growth.move_to_end(key)
+            return self._log_growth[key]
+
+        growth = 1 + value * returns
+        prefix = None
+        if (growth > 0).all():
+            prefix = np.concatenate(([0.0], np.cumsum(np.log(growth))))
+        self._log_growth[key] = prefix
+        while len(self._log_growth) > self.LOG_GROWTH_ENTRIES:
+            self._log_growth.popitem(last=False)
+        return prefix
+
+    def run_sparse(self, signal) -> dict:
+        """
+        Run a change-point signal without expanding it to one value per bar.
+
+        Transaction costs are computed from the change points alone, and
+        the PnL of each run is a segment product of (1 + position x return),
+        read off a shared log-growth prefix in O(1) per run. Values match
+        run() to floating-point tolerance, with the same NaN handling:
+        bars with no signal, or right after one, are skipped.
+
+        Parameters:
+            signal (SparseSignal | array-like): Positions; dense vectors are
+                encoded first.
+
+        Returns:
+            dict (one entry per run):
+                "Run_Start": first bar of the run
+                "Value": position held during the run
+                "Transaction_Cost": cost paid at the run's first bar
+                "Run_Return": compounded net return from the run's first bar
+                    through its last bar (the first bar earns the previous
+                    position, less the change cost)
+                "Equity": equity at the run's last bar
+        """
+        if self.data is None:
+            self.load_data()
+
+        if not isinstance(signal, SparseSignal):
+            signal = SparseSignal.from_dense(np.asarray(signal, dtype=np.float64))
+        if len(signal) != len(self.data):
+            raise ValueError(f"signal must have {len(self.data)} bars, got {len(signal)}")
+
+        returns = self.data["Returns"].to_numpy(dtype=np.float64)
+        starts, ends = signal.starts, signal.ends
+        values = signal.values.astype(np.float64)
+        prev = np.concatenate(([np.nan], values[:-1]))
+
+        # Transaction cost model: only change points trade
+        cost = np.abs(values - prev) * self.commission
+
+        # First bar of each run earns the previous position, less the cost
+        # (NaN when either side of the change is NaN: run() skips that bar)
+        entry_growth = 1 + np.nan_to_num(prev * returns[starts]) - cost
+        growth = np.where(np.isnan(entry_growth), 1.0, entry_growth)
+
+        # Remaining bars of each run earn the run's own position
+        inner_start = starts + 1
+        for value in np.unique(values[~np.isnan(values) & (values != 0)]):
+            runs = np.flatnonzero(values == value)
+            prefix = self._run_log_growth(value, returns)
+            if prefix is not None:
+                growth[runs] *= np.exp(prefix[ends[runs]] - prefix[inner_start[runs]])
+            else:
+                # Segment products straight from the dense growth vector
+                dense = np.append(1 + value * returns, 1.0)
+                bounds = np.column_stack((inner_start[runs], ends[runs])).ravel()
+                segment = np.multiply.reduceat(dense, bounds)[::2]
+                growth[runs] *= np.where(inner_start[runs] < ends[runs], segment, 1.0)
+
+        equity = self.initial_capital * np.cumprod(growth)
+
+        return {
+            "Run_Start": starts,
+            "Value": values,
+            "Transaction_Cost": cost,
+            "Run_Return": growth - 1,
+            "Equity": equity,
+        }
+
+    def _continue_pnl(self, signal, returns, prev_signal=np.nan, growth=1.0):
+        """
+        Apply the run() PnL and cost model to a block of bars that follows
+        earlier history, given the last position and compounded growth
+        before the block. Returns (result columns, growth after the block).
+        """
+        prev = np.concatenate(([prev_signal], signal[:-1]))
+
+        # PnL = position * next_day_return
+        strategy_returns = np.nan_to_num(prev * returns)
+
+        # Transaction cost model
+        trade = np.abs(signal - prev)
+        cost = trade * self.commission
+        net = strategy_returns - cost
+
+        # Equity Curve, continued from the previous block
+        missing = np.isnan(net)
+        equity = np.cumprod(np.where(missing, 1.0, 1.0 + net)) * growth
+        growth = equity[-1]
+        equity *= self.initial_capital
+        equity[missing] = np.nan
+
+        columns = {
+            "Signal": signal,
+            "Strategy_Returns": strategy_returns,
+            "Trade": trade,
+            "Transaction_Cost": cost,
+            "Net_Returns": net,
+            "Equity": equity,
+        }
+        return columns, growth
+
+    # ---------------------------------------------------------
+    # Chunked Execution (out-of-core histories)
+    # ---------------------------------------------------------
+    def iter_chunks(self, chunksize: int = 1_000_000, lookback: int = 500):
+        """
+        Stream the CSV through signal generation and PnL in record batches.
+
+        Only `chunksize` new rows plus `lookback` rows of history are held
+        at once. The history tail is prepended to each batch so indicators
+        start warm, and the previous close, last position and compounded
+        equity are carried across batch boundaries.
+
+        Parameters:
+            chunksize (int): Rows read from the CSV per batch.
+            lookback (int): Rows of prior history given to the strategy.
+                Must cover the longest indicator window; EMA-based
+                indicators converge within a few multiples of their span.
+
+        Yields:
+            pd.DataFrame: Result rows for each batch, same columns as run().
+        """
+        history = None
+        prev_close = np.nan
+        prev_signal = np.nan
+        growth = 1.0
+
+        for chunk in pd.read_csv(self.data_path, chunksize=chunksize):
+            if "Close" not in chunk.columns:
+                raise ValueError("Missing required column: Close")
+
+            close = chunk["Close"].to_numpy(dtype=np.float64)
+            chunk["Returns"] = close / np.concatenate(([prev_close], close[:-1])) - 1
+            prev_close = close[-1]
+            chunk = chunk.dropna()
+            if chunk.empty:
+                continue
+
+            frame = chunk if history is None else pd.concat([history, chunk])
+            signal = (
+                pd.Series(self.strategy.generate_signals(frame))
+                .reindex(frame.index)
+                .to_numpy(dtype=np.float64)[-len(chunk):]
+            )
+            history = frame.iloc[-lookback:] if lookback > 0 else None
+
+            columns, growth = self._continue_pnl(
+                signal, chunk["Returns"].to_numpy(), prev_signal, growth
+            )
+            prev_signal = signal[-1]
+
+            yield chunk.assign(**columns)
+
+    def run_chunked(self, out_path="backtest_results.csv", chunksize: int = 1_000_000, lookback: int = 500):
+        """
+        Run the backtest out-of-core, appending each batch of results to out_path.
+
+        Returns:
+            dict: Number of result rows written and the final equity value.
+        """
+        n_rows = 0
+        final_equity = self.initial_capital
+        for i, result in enumerate(self.iter_chunks(chunksize=chunksize, lookback=lookback)):
+            result.to_csv(out_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+            n_rows += len(result)
+            equity = result["Equity"].dropna()
+            if not equity.empty:
+                final_equity = equity.iloc[-1]
+        return {"rows": n_rows, "final_equity": final_equity}
+
+    # ---------------------------------------------------------
+    # Incremental Append
+    # ---------------------------------------------------------
+    def append(self, new_bars: pd.DataFrame, previous=None, lookback: int = 500):
+        """
+        Extend existing results with new bars without recomputing history.
+
+        The strategy only sees the last `lookback` rows of the stored
+        results plus the new bars, and equity continues from the last
+        position and compounded growth carried over from the previous
+        append, so the cost depends on the number of new bars rather
+        than on the length of the history. Appended rows are buffered and
+        concatenated onto self.results once, the next time it is read.
+
+        Parameters:
+            new_bars (pd.DataFrame): New rows with at least a 'Close' column.
+            previous (str | pd.DataFrame): Optional checkpoint to extend (a
+                frame, or a path saved by save_results()); defaults to self.results.
+            lookback (int): Rows of stored history handed to the strategy.
+                Must cover the longest indicator window.
+
+        Returns:
+            pd.DataFrame: The result rows of the appended bars.
+        """
+        if previous is not None:
+            if isinstance(previous, pd.DataFrame):
+                self.results = previous
+            elif str(previous).endswith((".arrow", ".feather")):
+                self.results = self.load_results(previous)
+            else:
+                self.results = pd.read_csv(previous)
+
+        if self._results is None:
+            raise RuntimeError("Run backtest or pass a checkpoint before calling append().")
+
+        state = self._append_state
+        if state is None or (lookback > len(state["tail"]) and state["rows"] > len(state["tail"])):
+            state = self._append_state = self._start_append(self.results, lookback)
+
+        new = new_bars.copy()
+        if "Close" not in new.columns:
+            raise ValueError("Missing required column: Close")
+        if state["next_label"] is not None:
+            start = state["next_label"]
+            new.index = pd.RangeIndex(start, start + len(new))
+
+        close = new["Close"].to_numpy(dtype=np.float64)
+        new["Returns"] = close / np.concatenate(([state["close"]], close[:-1])) - 1
+        new = new.dropna()
+        if new.empty:
+            return new.reindex(columns=state["columns"])
+
+        # Only the look-back tail of history is needed to warm up indicators
+        input_cols = [c for c in new.columns if c in state["columns"]]
+        frame = pd.concat([state["tail"][input_cols], new[input_cols]])
+        signal = (
+            pd.Series(self.strategy.generate_signals(frame))
+            .reindex(frame.index)
+            .to_numpy(dtype=np.float64)[-len(new):]
+        )
+
+        columns, growth = self._continue_pnl(
+            signal, new["Returns"].to_numpy(), state["signal"], state["growth"]
+        )
+        new = new.assign(**columns)
+
+        # Keep the checkpoint's layout and dtypes (e.g. compact results)
+        if pd.api.types.is_integer_dtype(state["dtypes"]["Signal"]):
+            new["Signal"] = np.nan_to_num(new["Signal"])
+        new = new.reindex(columns=state["columns"]).astype(state["dtypes"])
+
+        self._appended.append(new)
+        self._cache_key = None
+        state["tail"] = pd.concat([state["tail"], new]).iloc[-lookback:] if lookback > 0 else new.iloc[:0]
+        state["rows"] += len(new)
+        state["close"] = float(new["Close"].iloc[-1])
+        state["signal"] = float(new["Signal"].iloc[-1])
+        state["growth"] = growth
+        if state["next_label"] is not None:
+            state["next_label"] = new.index[-1] + 1
+        return new
+
+    def _start_append(self, prev: pd.DataFrame, lookback: int) -> dict:
+        """State carried from one append() to the next, read off the stored results."""
+        equity = prev["Equity"].dropna()
+        return {
+            "tail": prev.iloc[-lookback:] if lookback > 0 else prev.iloc[:0],
+            "rows": len(prev),
+            "close": float(prev["Close"].iloc[-1]),
+            "signal": float(prev["Signal"].iloc[-1]),
+            "growth": equity.iloc[-1] / self.initial_capital if not equity.empty else 1.0,
+            "next_label": prev.index[-1] + 1 if pd.api.types.is_integer_dtype(prev.index) else None,
+            "columns": prev.columns,
+            "dtypes": prev.dtypes.to_dict(),
+        }
+
+    def _flush_appended(self):
+        """Concatenate the rows buffered by append() onto the results."""
+        was_data = self._results is self._data
+        self._results = pd.concat([self._results, *self._appended])
+        self._appended = []
+        if was_data:
+            self.data = self._results
+
     # ---------------------------------------------------------
     # Metrics
     # ---------------------------------------------------------
@@ -104,8 +559,32 @@ class Backtester:
         if self.results is None:
             raise RuntimeError("Run backtest before calling get_metrics().")
 
+        if self._cache_key is not None:
+            cached = self.cache.get_metrics(self._cache_key)
+            if cached is not None:
+                return cached
+
         m = Metrics(self.results["Net_Returns"], self.results["Equity"])
-        return m.compute_all()
+        metrics = m.compute_all()
+
+        if self._cache_key is not None:
+            self.cache.put_metrics(self._cache_key, metrics)
+        return metrics
+
+    def trades(self) -> TradeLedger:
+        """
+        Round-trip trade ledger of the last run (entry, exit, side, holding
+        period and PnL per trade); .stats() gives per-trade win rate,
+        payoff ratio, etc. instead of the per-bar ones in get_metrics().
+        """
+        if self.results is None:
+            raise RuntimeError("Run backtest before calling trades().")
+
+        res = self.results
+        labels = res["Date"] if "Date" in res.columns else res.index
+        return TradeLedger.from_signals(
+            res["Signal"], res["Close"], commission=self.commission, index=labels
+        )
 
     # ---------------------------------------------------------
     # Plotting
@@ -125,6 +604,39 @@ class Backtester:
     # Save Results
     # ---------------------------------------------------------
     def save_results(self, out_path="backtest_results.csv"):
+        """
+        Persist results. Paths ending in .arrow/.feather are written as an
+        uncompressed Arrow IPC file (columnar, dtypes preserved) that
+        load_results() can memory-map; anything else is written as CSV.
+        """
         if self.results is None:
             raise RuntimeError("Run backtest before saving results.")
-        self.results.to_csv(out_path, index=False)
+
+        if str(out_path).endswith((".arrow", ".feather")):
+            import pyarrow as pa
+
+            cols = list(self.results.columns)
+            # pa.array() on raw ndarrays keeps NaN as a value (not a null),
+            # so numeric columns stay zero-copy on read
+            table = pa.Table.from_arrays(
+                [pa.array(self.results[c].to_numpy()) for c in cols], names=cols
+            )
+            with pa.OSFile(str(out_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            self.results.to_csv(out_path, index=False)
+
+    @staticmethod
+    def load_results(path, memory_map: bool = True) -> pd.DataFrame:
+        """
+        Load results written by save_results(path.arrow) without a parse step.
+
+        With memory_map=True numeric columns are backed by the mapped file
+        rather than read into fresh buffers.
+        """
+        import pyarrow as pa
+
+        source = pa.memory_map(str(path), "r") if memory_map else pa.OSFile(str(path), "rb")
+        table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True)
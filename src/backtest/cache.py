@@ -0,0 +1,300 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache for Backtester results and metrics.
+
+    Entries are keyed on a fingerprint of:
+        - the bytes of the input data file
+        - the strategy class and its parameters
+        - the cost settings (initial capital, commission, slippage)
+
+    Editing the data file changes its fingerprint, so stale entries are
+    never served. Results are stored as Arrow IPC and memory-mapped back
+    on a hit; the least recently used entries are evicted once the cache
+    grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = ".backtest_cache", max_bytes: int = 2 * 1024**3):
+        """
+        Parameters:
+            cache_dir (str): Directory holding cached entries.
+            max_bytes (int): Size budget; LRU entries beyond it are evicted.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # (path, size, mtime_ns) -> content digest, so large files are
+        # only re-hashed when they actually change on disk
+        self._file_digests = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ---------------------------------------------------------
+    # Fingerprinting
+    # ---------------------------------------------------------
+    def file_digest(self, path) -> str:
+        """Content hash of a data file (memoized on size + mtime)."""
+        st = os.stat(path)
+        stamp = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._file_digests.get(stamp)
+        if digest is None:
+            h = hashlib.blake2b(digest_size=20)
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            digest = h.hexdigest()
+            self._file_digests[stamp] = digest
+        return digest
+
+    @staticmethod
+    def content_digest(obj):
+        """
+        Content hash of an arbitrary object (its pickled state), or None
+        when it cannot be pickled.
+        """
+        try:
+            blob = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{type(obj).__module__}.{type(obj).__qualname__}".encode())
+        h.update(blob)
+        return h.hexdigest()
+
+    _PRIMITIVES = (bool, int, float, complex, str, bytes, type(None))
+
+    def _param_token(self, value):
+        """
+        Stable token for one strategy parameter: repr() for primitives,
+        a content hash for anything else (e.g. a fitted model, whose repr
+        does not change when it is refit). None if it cannot be hashed.
+        """
+        if isinstance(value, self._PRIMITIVES):
+            return repr(value)
+        if isinstance(value, (tuple, list)) and all(isinstance(v, self._PRIMITIVES) for v in value):
+            return repr(value)
+        return self.content_digest(value)
+
+    def key(self, backtester, **extra):
+        """
+        Cache key for a Backtester configuration.
+
+        Strategy parameters are taken from vars(strategy); non-primitive
+        values are hashed by content, and caches held by the strategy are
+        ignored. Returns None -- the run is not cached -- when a parameter
+        can be neither repr'd nor pickled.
+        """
+        strategy = backtester.strategy
+        params = []
+        for name, value in vars(strategy).items():
+            if isinstance(value, ResultCache):
+                continue
+            token = self._param_token(value)
+            if token is None:
+                return None
+            params.append((name, token))
+
+        payload = {
+            "data": self.file_digest(backtester.data_path),
+            "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+            "params": sorted(params),
+            "costs": [backtester.initial_capital, backtester.commission, backtester.slippage],
+            "extra": sorted((k, repr(v)) for k, v in extra.items()),
+        }
+        blob = json.dumps(payload, sort_keys=True, default=repr).encode()
+        return hashlib.blake2b(blob, digest_size=20).hexdigest()
+
+    # ---------------------------------------------------------
+    # Results
+    # ---------------------------------------------------------
+    def _path(self, key, suffix):
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _touch(self, path) -> bool:
+        """Mark an entry as recently used; False if it was evicted meanwhile."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get_results(self, key):
+        """Return the cached results frame for key, or None on a miss."""
+        import pyarrow as pa
+
+        path = self._path(key, ".arrow")
+        if not self._touch(path):
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        except FileNotFoundError:
+            return None
+        return table.to_pandas(split_blocks=True)
+
+    def put_results(self, key, results: pd.DataFrame):
+        """Store a results frame (index and dtypes preserved)."""
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(results, preserve_index=True)
+        path = self._path(key, ".arrow")
+        tmp = path + ".tmp"
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+        self.evict()
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def get_metrics(self, key):
+        """Return the cached metrics dict for key, or None on a miss."""
+        path = self._path(key, ".metrics.json")
+        if not self._touch(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put_metrics(self, key, metrics: dict):
+        """Store a metrics dict."""
+        path = self._path(key, ".metrics.json")
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({k: float(v) for k, v in metrics.items()}, f)
+        os.replace(tmp, path)
+        self.evict()
+
+    # ---------------------------------------------------------
+    # Eviction
+    # ---------------------------------------------------------
+    def _entries(self) -> list:
+        """(mtime_ns, size, path) of every stored entry still on disk."""
+        entries = []
+        for e in os.scandir(self.cache_dir):
+            if not e.is_file() or e.name.endswith(".tmp"):
+                continue
+            try:
+                st = e.stat()
+            except FileNotFoundError:
+                # Removed by a concurrent evict() or clear()
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, e.path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes used by cached entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        for e in os.scandir(self.cache_dir):
+            if e.is_file():
+                try:
+                    os.remove(e.path)
+                except FileNotFoundError:
+                    pass
+
+
+class PredictionCache(ResultCache):
+    """
+    Persistent cache of raw model outputs for MLStrategy.
+
+    Entries hold the raw predictions (or P(class 1)) of one batch of
+    feature rows, keyed on a fingerprint of the fitted model and a hash of
+    the batch's feature bytes. Threshold sweeps over the same features
+    and model then only re-apply thresholds, and after new bars are
+    appended only the batches whose rows changed reach the model again.
+
+    Batches may be read and written from several threads at once: the
+    hit/miss counters and eviction are guarded by a lock, and
+    put_predictions() does not evict -- callers run evict() once after a
+    whole pass (MLStrategy does so after its thread pool finishes).
+    """
+
+    def __init__(self, cache_dir: str = ".prediction_cache", max_bytes: int = 1024**3):
+        """
+        Parameters:
+            cache_dir (str): Directory holding cached entries.
+            max_bytes (int): Size budget; LRU entries beyond it are evicted.
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Fingerprinting
+    # ---------------------------------------------------------
+    @classmethod
+    def model_fingerprint(cls, model):
+        """
+        Content hash of a fitted model (its pickled state), or None when
+        the model cannot be pickled -- such models are never cached.
+        """
+        return cls.content_digest(model)
+
+    @staticmethod
+    def chunk_key(model_fp: str, output: str, X: np.ndarray) -> str:
+        """Key for one batch: model fingerprint, output kind and feature bytes."""
+        X = np.ascontiguousarray(X)
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{model_fp}|{output}|{X.dtype.str}|{X.shape}".encode())
+        h.update(memoryview(X).cast("B"))
+        return h.hexdigest()
+
+    # ---------------------------------------------------------
+    # Predictions
+    # ---------------------------------------------------------
+    def get_predictions(self, key):
+        """Return the cached raw output array for key, or None on a miss."""
+        path = self._path(key, ".npy")
+        raw = None
+        if self._touch(path):
+            try:
+                raw = np.load(path)
+            except FileNotFoundError:
+                # Evicted between the touch and the read
+                pass
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return raw
+
+    def put_predictions(self, key, raw: np.ndarray):
+        """Store the raw output array of one batch."""
+        path = self._path(key, ".npy")
+        # Batches may be scored concurrently on a thread pool
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(raw))
+        os.replace(tmp, path)
+
+    def evict(self):
+        """ResultCache.evict(), serialized across threads."""
+        with self._lock:
+            super().evict()
@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+
+from ..metrics import Metrics
+
+
+class PortfolioBacktester:
+    """
+    Multi-asset backtesting engine over aligned (time x asset) panels.
+
+    Works alongside Backtester: instead of one Close column and one signal
+    vector it takes a price panel plus a weight (or signal) panel and
+    computes per-asset returns, turnover-based commissions, aggregate
+    portfolio returns and equity with matrix operations. Rows are
+    processed in blocks, so temporaries stay O(block_size x assets)
+    however long the history is.
+
+    Weights decided at the close of bar t earn the asset returns of bar
+    t+1 (the same one-bar lag as Backtester). Missing weights -- warm-up,
+    names not yet listed or already delisted -- are treated as flat.
+
+    Asset returns are computed on forward-filled prices: a bar without a
+    price returns 0, and the whole move across a gap is realized on the
+    first bar that has a price again, earned by the weight held into it.
+    """
+
+    def __init__(
+        self,
+        prices,
+        strategy=None,
+        initial_capital: float = 100_000,
+        commission: float = 0.0,
+        trading_days: int = 252,
+        block_size: int = 4096,
+        dtype=np.float64,
+    ):
+        """
+        Parameters:
+            prices (pd.DataFrame | str): Close prices, one column per asset,
+                or a path to a wide CSV (an optional 'Date' column is used
+                as the index).
+            strategy (object): Optional strategy with .generate_panel_signals(prices),
+                used when run() is not given weights or signals.
+            initial_capital (float): Starting portfolio value.
+            commission (float): Cost per unit of turnover (sum of |weight change|).
+            trading_days (int): Annualization factor for get_metrics().
+            block_size (int): Rows processed per block.
+            dtype: Float dtype of the per-asset matrices (np.float32 halves memory).
+        """
+        self.prices = self._load_prices(prices)
+        self.strategy = strategy
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.trading_days = trading_days
+        self.block_size = block_size
+        self.dtype = dtype
+
+        self.weights = None
+        self.asset_returns = None
+        self.results = None
+
+    @staticmethod
+    def _load_prices(prices) -> pd.DataFrame:
+        if isinstance(prices, pd.DataFrame):
+            return prices
+        df = pd.read_csv(prices)
+        if "Date" in df.columns:
+            df = df.set_index("Date")
+        return df
+
+    # ---------------------------------------------------------
+    # Weights
+    # ---------------------------------------------------------
+    @staticmethod
+    def signals_to_weights(signals) -> pd.DataFrame:
+        """
+        Equal-weight every open position: each row is scaled so that gross
+        exposure (sum of |weight|) is 1, or 0 when nothing is held.
+        """
+        sig = pd.DataFrame(signals)
+        values = np.nan_to_num(sig.to_numpy(dtype=np.float64))
+        gross = np.abs(values).sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.where(gross > 0, values / gross, 0.0)
+        return pd.DataFrame(weights, index=sig.index, columns=sig.columns)
+
+    def _align(self, panel) -> np.ndarray:
+        if isinstance(panel, pd.DataFrame):
+            panel = panel.reindex(index=self.prices.index, columns=self.prices.columns)
+        values = np.asarray(panel, dtype=self.dtype)
+        if values.shape != self.prices.shape:
+            raise ValueError(
+                f"weights must have shape {self.prices.shape}, got {values.shape}"
+            )
+        return values
+
+    # ---------------------------------------------------------
+    # Execute Portfolio
+    # ---------------------------------------------------------
+    def run(self, weights=None, signals=None, keep_asset_returns: bool = True):
+        """
+        Run the portfolio and compute the aggregate equity curve.
+
+        Parameters:
+            weights (pd.DataFrame | np.ndarray): Target weights per bar and asset.
+            signals (pd.DataFrame | np.ndarray): Positions (+1, 0, -1) per bar
+                and asset, turned into weights by signals_to_weights().
+                If neither is given, the strategy's panel signals are used.
+            keep_asset_returns (bool): Store the (bars x assets) per-asset
+                return contributions in self.asset_returns.
+
+        Returns:
+            pd.DataFrame: Gross_Returns, Turnover, Transaction_Cost,
+                Net_Returns and Equity per bar.
+        """
+        if weights is None:
+            if signals is None:
+                if self.strategy is None:
+                    raise ValueError("Pass weights or signals, or give a strategy.")
+                signals = self.strategy.generate_panel_signals(self.prices)
+            weights = self.signals_to_weights(signals)
+
+        w = np.nan_to_num(self._align(weights))
+        prices = self.prices.to_numpy(dtype=np.float64)
+        n_bars = len(prices)
+
+        gross = np.zeros(n_bars)
+        turnover = np.zeros(n_bars)
+        contributions = np.zeros(w.shape, dtype=self.dtype) if keep_asset_returns else None
+
+        columns = np.arange(prices.shape[1])
+        prev_close = np.full(prices.shape[1], np.nan)
+        prev_w = np.zeros(prices.shape[1], dtype=self.dtype)
+        for start in range(0, n_bars, self.block_size):
+            stop = min(start + self.block_size, n_bars)
+
+            # Forward-fill prices, seeded with the last price seen per asset
+            close = np.vstack((prev_close, prices[start:stop]))
+            last = np.where(np.isnan(close), 0, np.arange(len(close))[:, None])
+            np.maximum.accumulate(last, axis=0, out=last)
+            close = close[last, columns]
+
+            # Per-asset returns; no price (gap / not listed / delisted) -> 0
+            returns = close[1:] / close[:-1] - 1
+            np.nan_to_num(returns, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+            # PnL = previous bar's weight * this bar's return
+            held = np.vstack((prev_w, w[start:stop - 1]))
+            pnl = held * returns.astype(self.dtype, copy=False)
+            gross[start:stop] = pnl.sum(axis=1, dtype=np.float64)
+            if contributions is not None:
+                contributions[start:stop] = pnl
+
+            # Turnover-based transaction costs
+            turnover[start:stop] = np.abs(w[start:stop] - held).sum(axis=1, dtype=np.float64)
+
+            prev_close = close[-1]
+            prev_w = w[stop - 1]
+
+        cost = turnover * self.commission
+        net = gross - cost
+        equity = self.initial_capital * np.cumprod(1 + net)
+
+        self.weights = w
+        if contributions is not None:
+            self.asset_returns = pd.DataFrame(
+                contributions, index=self.prices.index, columns=self.prices.columns, copy=False
+            )
+        self.results = pd.DataFrame(
+            {
+                "Gross_Returns": gross,
+                "Turnover": turnover,
+                "Transaction_Cost": cost,
+                "Net_Returns": net,
+                "Equity": equity,
+            },
+            index=self.prices.index,
+        )
+        return self.results
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def get_metrics(self):
+        """Metrics.compute_all() of the aggregate portfolio."""
+        if self.results is None:
+            raise RuntimeError("Run backtest before calling get_metrics().")
+
+        m = Metrics(self.results["Net_Returns"], self.results["Equity"], trading_days=self.trading_days)
+        return m.compute_all()
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from ..feature_view import strategy_signals
+
+
+class SparseSignal:
+    """
+    Change-point representation of a position vector.
+
+    Stores only the bar index where each run of identical positions
+    starts and the position held during that run, so a million-bar signal
+    that changes a few hundred times takes a few kilobytes instead of
+    8 MB. NaN (no signal yet) is a regular run value. The dense vector is
+    only built on demand by to_dense() / np.asarray().
+    """
+
+    def __init__(self, starts, values, length: int):
+        """
+        Parameters:
+            starts (array-like): Increasing bar indices where runs begin (first is 0).
+            values (array-like): Position held from each start to the next.
+            length (int): Number of bars of the dense signal.
+        """
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.length = int(length)
+
+    @classmethod
+    def from_dense(cls, signal) -> "SparseSignal":
+        """Run-length encode a dense signal (NaN runs are kept as NaN)."""
+        s = np.asarray(signal, dtype=np.float64)
+        if len(s) == 0:
+            return cls([], [], 0)
+        prev, cur = s[:-1], s[1:]
+        same = (prev == cur) | (np.isnan(prev) & np.isnan(cur))
+        starts = np.concatenate(([0], np.flatnonzero(~same) + 1))
+        return cls(starts, s[starts], len(s))
+
+    @classmethod
+    def from_strategy(cls, strategy, data) -> "SparseSignal":
+        """Encode a strategy's full-length signal over a frame or FeatureView."""
+        return cls.from_dense(strategy_signals(strategy, data))
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def n_runs(self) -> int:
+        return len(self.starts)
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Exclusive end bar of each run."""
+        return np.append(self.starts[1:], self.length)
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.values.nbytes
+
+    def to_dense(self, dtype=np.float64) -> np.ndarray:
+        """Expand to a full-length position vector."""
+        return np.repeat(self.values.astype(dtype), np.diff(self.ends, prepend=0))
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_dense(np.float64 if dtype is None else dtype)
+
+    def to_series(self, index=None) -> pd.Series:
+        return pd.Series(self.to_dense(), index=index)
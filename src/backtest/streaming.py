@@ -0,0 +1,112 @@
+import math
+
+import pandas as pd
+
+
+class StreamingBacktester:
+    """
+    Event-driven counterpart of Backtester for paper trading and live shadowing.
+
+    Bars are pushed one at a time through on_bar(); position, strategy
+    return, transaction cost and equity are carried as scalar state and
+    updated in O(1) per bar. Replaying a history bar by bar reproduces
+    the columns of the vectorized Backtester.run() exactly.
+    """
+
+    def __init__(self, initial_capital: float = 100_000, commission: float = 0.0):
+        """
+        Parameters:
+            initial_capital (float): Starting portfolio value.
+            commission (float): Cost per trade.
+        """
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.reset()
+
+    def reset(self):
+        """Clear all carried state."""
+        self.prev_close = None
+        self.prev_signal = math.nan
+        self.growth = 1.0
+        self.equity = math.nan
+        self.n_bars = 0
+
+    # ---------------------------------------------------------
+    # Per-Bar Update
+    # ---------------------------------------------------------
+    def on_bar(self, bar):
+        """
+        Consume one bar and return its result row.
+
+        Parameters:
+            bar (mapping): Must provide "Close" and "Signal" (+1, 0, -1 or
+                NaN while the strategy is warming up).
+
+        Returns:
+            dict | None: Returns, Signal, Strategy_Returns, Trade,
+                Transaction_Cost, Net_Returns and Equity for this bar, or
+                None for the very first bar (no return to compute yet, the
+                row run() drops after pct_change()).
+        """
+        close = float(bar["Close"])
+        signal = float(bar["Signal"])
+
+        prev_close = self.prev_close
+        self.prev_close = close
+        if prev_close is None:
+            return None
+
+        ret = close / prev_close - 1
+        prev_signal = self.prev_signal
+        self.prev_signal = signal
+        self.n_bars += 1
+
+        # PnL = position * next_day_return
+        strategy_return = prev_signal * ret
+        if math.isnan(strategy_return):
+            strategy_return = 0.0
+
+        # Transaction cost model
+        trade = abs(signal - prev_signal)
+        cost = trade * self.commission
+        net = strategy_return - cost
+
+        # Equity Curve (NaN bars leave the compounded level untouched)
+        if math.isnan(net):
+            equity = math.nan
+        else:
+            self.growth *= 1 + net
+            equity = self.initial_capital * self.growth
+            self.equity = equity
+
+        return {
+            "Close": close,
+            "Returns": ret,
+            "Signal": signal,
+            "Strategy_Returns": strategy_return,
+            "Trade": trade,
+            "Transaction_Cost": cost,
+            "Net_Returns": net,
+            "Equity": equity,
+        }
+
+    # ---------------------------------------------------------
+    # Replay
+    # ---------------------------------------------------------
+    def replay(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Push every row of a frame with Close and Signal columns through on_bar().
+
+        Returns:
+            pd.DataFrame: One row per emitted bar (the first input row is consumed
+                as the reference price).
+        """
+        self.reset()
+        rows = []
+        index = []
+        for idx, close, signal in zip(df.index, df["Close"], df["Signal"]):
+            row = self.on_bar({"Close": close, "Signal": signal})
+            if row is not None:
+                rows.append(row)
+                index.append(idx)
+        return pd.DataFrame(rows, index=index)
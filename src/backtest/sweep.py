@@ -0,0 +1,165 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .backtest import Backtester
+from ..feature_view import FeatureView, strategy_signals
+from ..indicator_cache import IndicatorCache, set_cache
+from ..metrics import Metrics
+
+
+# Per-process state, populated once by _attach_worker()
+_WORKER = {}
+
+
+def _attach_worker(shm_name, n_bars, strategy_cls, initial_capital, commission, trading_days):
+    """Attach a worker process to the shared Close/Returns block."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    prices = np.ndarray((2, n_bars), dtype=np.float64, buffer=shm.buf)
+
+    # Read-only frame backed by the shared buffer (no per-task pickling)
+    bt = Backtester(None, None, initial_capital=initial_capital, commission=commission)
+    bt.data = pd.DataFrame({"Close": prices[0], "Returns": prices[1]}, copy=False)
+
+    # Indicators shared between parameter sets (e.g. the same slow SMA)
+    # are computed once per worker
+    set_cache(IndicatorCache())
+
+    _WORKER.update(
+        shm=shm,
+        backtester=bt,
+        view=FeatureView(bt.data),
+        strategy_cls=strategy_cls,
+        trading_days=trading_days,
+    )
+
+
+def _run_chunk(param_chunk):
+    """Backtest a chunk of parameter sets; return only the metrics dicts."""
+    bt = _WORKER["backtester"]
+    strategy_cls = _WORKER["strategy_cls"]
+
+    out = []
+    for params in param_chunk:
+        signals = strategy_signals(strategy_cls(**params), _WORKER["view"])
+
+        res = bt.run_batch(signals)
+        m = Metrics(
+            pd.Series(res["Net_Returns"][:, 0]),
+            pd.Series(res["Equity"][:, 0]),
+            trading_days=_WORKER["trading_days"],
+        )
+        out.append(m.compute_all())
+    return out
+
+
+class ParameterSweep:
+    """
+    Parallel parameter-grid backtester.
+
+    Splits a strategy parameter grid across a ProcessPoolExecutor.
+    Close/Returns are loaded once into shared memory and every worker
+    attaches to that block, so per-worker memory does not grow with the
+    length of the price history and no DataFrame is pickled per task.
+
+    Works with any strategy class exposing .generate_signals(df)
+    (SMAStrategy, RSIStrategy, MACDStrategy, ...).
+    """
+
+    def __init__(
+        self,
+        data_path: str,
+        strategy_cls,
+        param_grid: dict,
+        initial_capital: float = 100_000,
+        commission: float = 0.0,
+        trading_days: int = 252,
+        max_workers: int = None,
+        chunks_per_worker: int = 4,
+    ):
+        """
+        Parameters:
+            data_path (str): Path to CSV with market data (must contain 'Close').
+            strategy_cls (type): Strategy class; instantiated as strategy_cls(**params).
+            param_grid (dict): Parameter name -> list of values (full cartesian grid).
+            initial_capital (float): Starting portfolio value.
+            commission (float): Cost per trade.
+            trading_days (int): Annualization factor passed to Metrics.
+            max_workers (int): Worker processes (default: os.cpu_count()).
+            chunks_per_worker (int): Task chunks per worker, for load balancing.
+        """
+        self.data_path = data_path
+        self.strategy_cls = strategy_cls
+        self.param_grid = param_grid
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.trading_days = trading_days
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    # ---------------------------------------------------------
+    # Grid Expansion
+    # ---------------------------------------------------------
+    def expand_grid(self):
+        """Return the cartesian product of param_grid as a list of dicts."""
+        keys = list(self.param_grid)
+        return [
+            dict(zip(keys, values))
+            for values in itertools.product(*(self.param_grid[k] for k in keys))
+        ]
+
+    def _chunk(self, params):
+        n_chunks = max(1, min(len(params), self.max_workers * self.chunks_per_worker))
+        size = -(-len(params) // n_chunks)
+        return [params[i:i + size] for i in range(0, len(params), size)]
+
+    # ---------------------------------------------------------
+    # Execute Sweep
+    # ---------------------------------------------------------
+    def run(self) -> pd.DataFrame:
+        """
+        Run every parameter set and return one row of metrics per set.
+
+        Returns:
+            pd.DataFrame: Parameter columns followed by Metrics.compute_all() columns.
+        """
+        loader = Backtester(self.data_path, None)
+        loader.load_data()
+        n_bars = len(loader.data)
+
+        params = self.expand_grid()
+        if not params:
+            return pd.DataFrame()
+
+        shm = shared_memory.SharedMemory(create=True, size=2 * n_bars * 8)
+        try:
+            prices = np.ndarray((2, n_bars), dtype=np.float64, buffer=shm.buf)
+            prices[0] = loader.data["Close"].to_numpy(dtype=np.float64)
+            prices[1] = loader.data["Returns"].to_numpy(dtype=np.float64)
+            del loader
+
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_attach_worker,
+                initargs=(
+                    shm.name,
+                    n_bars,
+                    self.strategy_cls,
+                    self.initial_capital,
+                    self.commission,
+                    self.trading_days,
+                ),
+            ) as pool:
+                metrics = [
+                    m for chunk in pool.map(_run_chunk, self._chunk(params)) for m in chunk
+                ]
+            del prices
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return pd.concat([pd.DataFrame(params), pd.DataFrame(metrics)], axis=1)
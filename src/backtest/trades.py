@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+
+class TradeLedger:
+    """
+    Array-backed list of round-trip trades extracted from a position vector.
+
+    A trade is a maximal run of bars with the same non-zero position. One
+    O(n) pass finds the change points (run-length encoding of the signal)
+    and per-trade returns are segment products via np.multiply.reduceat,
+    so there are no Python-level loops over bars or trades and every
+    statistic afterwards costs O(number of trades).
+
+    Fields (one NumPy array each, one entry per trade):
+        entry      bar index where the position is opened (at the close)
+        exit       bar index where it is closed, or -1 if still open
+        side       position held (+1 long, -1 short, or the signal size)
+        bars_held  number of bars whose return the trade earns
+        gross      compounded return before costs
+        pnl        compounded return after entry/exit commissions
+    """
+
+    FIELDS = ("entry", "exit", "side", "bars_held", "gross", "pnl")
+
+    def __init__(self, entry, exit, side, bars_held, gross, pnl, index=None):
+        self.entry = entry
+        self.exit = exit
+        self.side = side
+        self.bars_held = bars_held
+        self.gross = gross
+        self.pnl = pnl
+        self.index = index
+
+    def __len__(self):
+        return len(self.entry)
+
+    # ---------------------------------------------------------
+    # Extraction
+    # ---------------------------------------------------------
+    @classmethod
+    def from_signals(cls, signal, close, commission: float = 0.0, index=None):
+        """
+        Build the ledger from the Backtester position model: the position
+        set at bar t earns the return of bar t+1, and each entry and exit
+        pays `commission` x |position|.
+
+        Parameters:
+            signal (array-like): Position per bar (NaN = flat).
+            close (array-like): Close price per bar.
+            commission (float): Cost per unit of position traded.
+            index (pd.Index): Optional bar labels used by to_frame().
+        """
+        s = np.nan_to_num(np.asarray(signal, dtype=np.float64))
+        close = np.asarray(close, dtype=np.float64)
+        n = len(s)
+        if n == 0:
+            empty = np.array([], dtype=np.int64)
+            return cls(empty, empty, np.array([]), empty, np.array([]), np.array([]), index)
+
+        # Run-length encoding of the position vector
+        change = np.flatnonzero(s[1:] != s[:-1]) + 1
+        starts = np.concatenate(([0], change))
+        ends = np.concatenate((change, [n]))
+        is_trade = s[starts] != 0
+
+        # growth[t] = 1 + position(t) * return(t+1); the last bar earns nothing
+        growth = np.ones(n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.multiply(s[:-1], close[1:] / close[:-1] - 1, out=growth[:-1])
+        growth[:-1] += 1
+        growth[np.isnan(growth)] = 1.0
+
+        # Product of growth over each run = compounded return of that run
+        run_growth = np.multiply.reduceat(growth, starts)
+
+        entry = starts[is_trade]
+        end = ends[is_trade]
+        side = s[entry]
+        closed = end < n
+        gross = run_growth[is_trade] - 1
+
+        side_cost = commission * np.abs(side)
+        pnl = (1 + gross) * (1 - side_cost) * np.where(closed, 1 - side_cost, 1.0) - 1
+
+        return cls(
+            entry=entry,
+            exit=np.where(closed, end, -1),
+            side=side,
+            bars_held=np.where(closed, end, n - 1) - entry,
+            gross=gross,
+            pnl=pnl,
+            index=index,
+        )
+
+    # ---------------------------------------------------------
+    # Trade Statistics (O(number of trades))
+    # ---------------------------------------------------------
+    def stats(self) -> dict:
+        """
+        Trade-level counterparts of the Metrics trade statistics, computed
+        per round trip rather than per bar.
+        """
+        pnl = self.pnl
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+
+        average_win = wins.mean() if len(wins) else 0.0
+        average_loss = losses.mean() if len(losses) else 0.0
+        gross_loss = -losses.sum()
+
+        out = {
+            "Trades": len(pnl),
+            "Win Rate": len(wins) / (len(wins) + len(losses)) if len(wins) + len(losses) else 0.0,
+            "Profit Factor": wins.sum() / gross_loss if gross_loss > 0 else np.inf,
+            "Expectancy": pnl.mean() if len(pnl) else 0.0,
+            "Average Win": average_win,
+            "Average Loss": average_loss,
+            "Payoff Ratio": average_win / -average_loss if average_loss < 0 else np.inf,
+            "Average Bars Held": self.bars_held.mean() if len(pnl) else 0.0,
+            "Long Trades": int((self.side > 0).sum()),
+            "Short Trades": int((self.side < 0).sum()),
+        }
+        return {k: round(float(v), 6) for k, v in out.items()}
+
+    # ---------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------
+    def to_frame(self) -> pd.DataFrame:
+        """One row per trade; entry/exit labels added when an index was given."""
+        df = pd.DataFrame({name: getattr(self, name) for name in self.FIELDS})
+        if self.index is not None:
+            labels = pd.Index(self.index)
+            df["Entry_Label"] = labels[self.entry]
+            df["Exit_Label"] = labels[np.where(self.exit >= 0, self.exit, 0)]
+            df.loc[self.exit < 0, "Exit_Label"] = None
+        return df
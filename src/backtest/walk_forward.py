@@ -0,0 +1,180 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .backtest import Backtester
+from ..feature_view import FeatureView, strategy_signals
+from ..indicator_cache import get_cache, use_cache
+from ..metrics import Metrics
+
+
+class WalkForwardOptimizer:
+    """
+    Anchored or rolling walk-forward optimization.
+
+    Signals for every parameter set are generated once over the full
+    history (so each indicator is computed in a single pass rather than
+    once per fold) and run through Backtester.run_batch(). Folds are then
+    plain row slices of the resulting (bars x configurations) return
+    matrix: the best in-sample configuration is chosen per fold. Its
+    out-of-sample positions are stitched into one signal and run once
+    more, so fold boundaries earn the position actually held and pay
+    commission for switching configurations.
+    """
+
+    def __init__(
+        self,
+        data_path: str,
+        strategy_cls,
+        param_grid: dict,
+        n_folds: int = 5,
+        train_ratio: float = 0.5,
+        anchored: bool = True,
+        initial_capital: float = 100_000,
+        commission: float = 0.0,
+        trading_days: int = 252,
+    ):
+        """
+        Parameters:
+            data_path (str): Path to CSV with market data (must contain 'Close').
+            strategy_cls (type): Strategy class; instantiated as strategy_cls(**params).
+            param_grid (dict): Parameter name -> list of values (full cartesian grid).
+            n_folds (int): Number of out-of-sample segments.
+            train_ratio (float): Share of history used as the first in-sample window
+                (the same chronological split as Utils.time_series_split); the
+                rest is split into n_folds.
+            anchored (bool): Expanding in-sample window if True, otherwise a
+                rolling window of constant length.
+            initial_capital (float): Starting portfolio value.
+            commission (float): Cost per trade.
+            trading_days (int): Annualization factor.
+        """
+        self.data_path = data_path
+        self.strategy_cls = strategy_cls
+        self.param_grid = param_grid
+        self.n_folds = n_folds
+        self.train_ratio = train_ratio
+        self.anchored = anchored
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.trading_days = trading_days
+
+        self.backtester = Backtester(
+            data_path, None, initial_capital=initial_capital, commission=commission
+        )
+
+    # ---------------------------------------------------------
+    # Fold Layout
+    # ---------------------------------------------------------
+    def folds(self, n_bars: int):
+        """
+        Return [(train_slice, test_slice), ...] row slices for n_bars.
+
+        Out-of-sample segments are contiguous and non-overlapping, so the
+        stitched equity curve covers every bar after the first window.
+        """
+        first_train = int(n_bars * self.train_ratio)
+        if first_train <= 0 or n_bars - first_train < self.n_folds:
+            raise ValueError("Not enough data for the requested train_ratio / n_folds.")
+
+        bounds = np.linspace(first_train, n_bars, self.n_folds + 1).astype(int)
+        out = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            train_start = 0 if self.anchored else start - first_train
+            out.append((slice(train_start, start), slice(start, end)))
+        return out
+
+    # ---------------------------------------------------------
+    # Scoring
+    # ---------------------------------------------------------
+    @staticmethod
+    def sharpe_scores(net_returns: np.ndarray) -> np.ndarray:
+        """Column-wise Sharpe ratio (same definition as Metrics.sharpe)."""
+        mean = np.nanmean(net_returns, axis=0)
+        std = np.nanstd(net_returns, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(std > 0, mean / std, 0.0)
+        return np.nan_to_num(scores, nan=-np.inf)
+
+    # ---------------------------------------------------------
+    # Execute Walk-Forward
+    # ---------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Returns:
+            dict:
+                "folds": per-fold table of windows, chosen params and in-sample score
+                "results": stitched out-of-sample Net_Returns / Equity / Config
+                "metrics": Metrics.compute_all() of the stitched curve
+        """
+        bt = self.backtester
+        if bt.data is None:
+            bt.load_data()
+        data = bt.data
+
+        keys = list(self.param_grid)
+        configs = [
+            dict(zip(keys, values))
+            for values in itertools.product(*(self.param_grid[k] for k in keys))
+        ]
+
+        # One signal pass per configuration over the full history; indicators
+        # shared between configurations are memoized and computed once
+        view = FeatureView(data)
+        with use_cache(get_cache()):
+            signals = np.column_stack([
+                strategy_signals(self.strategy_cls(**p), view) for p in configs
+            ])
+        net = bt.run_batch(signals)["Net_Returns"]
+
+        # Traded path: each test segment holds its chosen config's positions,
+        # entered from the position actually held at the end of the previous
+        # segment (or the first choice's last in-sample position)
+        folds = self.folds(len(data))
+        stitched = np.full(len(data), np.nan)
+        config = np.zeros(len(data), dtype=np.int64)
+
+        fold_rows = []
+        for k, (train, test) in enumerate(folds):
+            scores = self.sharpe_scores(net[train])
+            best = int(np.argmax(scores))
+
+            fold_rows.append({
+                "Fold": k,
+                "Train_Start": data.index[train.start],
+                "Train_End": data.index[train.stop - 1],
+                "Test_Start": data.index[test.start],
+                "Test_End": data.index[test.stop - 1],
+                "Config": best,
+                **configs[best],
+                "In_Sample_Sharpe": scores[best],
+            })
+            if k == 0:
+                stitched[test.start - 1] = signals[test.start - 1, best]
+            stitched[test] = signals[test, best]
+            config[test] = best
+
+        # Boundary bars earn the previous segment's position and pay for
+        # the switch, as in one continuous run
+        first = folds[0][1].start
+        returns = bt.run_batch(stitched)["Net_Returns"][first:, 0]
+        growth = np.where(np.isnan(returns), 1.0, 1.0 + returns)
+        equity = self.initial_capital * np.cumprod(growth)
+        equity[np.isnan(returns)] = np.nan
+
+        results = pd.DataFrame(
+            {
+                "Net_Returns": returns,
+                "Equity": equity,
+                "Config": config[first:],
+            },
+            index=data.index[first:],
+        )
+
+        m = Metrics(results["Net_Returns"], results["Equity"], trading_days=self.trading_days)
+        return {
+            "folds": pd.DataFrame(fold_rows),
+            "results": results,
+            "metrics": m.compute_all(),
+        }
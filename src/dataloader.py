@@ -57,6 +57,26 @@ class DataLoader:
 
         return df
 
+    # ---------------------------------------------------------
+    # Load CSV File in Chunks (out-of-core)
+    # ---------------------------------------------------------
+    def load_chunks(self, chunksize: int = 1_000_000):
+        """
+        Yield cleaned record batches instead of loading the whole file.
+
+        The file is expected to be sorted by date already; each batch is
+        validated and cleaned like load(), so peak memory is bounded by
+        chunksize rather than by the length of the history.
+        """
+        parse_dates = [self.date_col] if self.parse_dates else None
+
+        for df in pd.read_csv(self.filepath, parse_dates=parse_dates, chunksize=chunksize):
+            for col in self.required_cols:
+                if col not in df.columns:
+                    raise ValueError(f"Missing required column: {col}")
+
+            yield df.dropna()
+
     # ---------------------------------------------------------
     # Load OHLCV (Optional)
     # ---------------------------------------------------------
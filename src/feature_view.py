@@ -0,0 +1,146 @@
+"""
+Read-only feature views for strategies.
+
+Strategies used to start generate_signals() with df.copy(), add
+indicator columns and dropna(), which duplicates the full price frame
+on every call. A FeatureView instead hands out read-only arrays: source
+columns are zero-copy views of the frame, and indicators come from the
+memoized functions in indicators.py (shared between strategies while an
+IndicatorCache is active). Signal generation then allocates only its
+output vector.
+
+Strategies implement compute_signals(view) -> np.ndarray, a full-length
+float64 vector that is NaN on rows where no signal is emitted; their
+generate_signals(df) entry points are adapters over it.
+
+A view can also be backed by a FeatureGraph (FeatureGraph.view()): its
+indicators are then read from the graph's nodes, so strategies share
+every node with the features stage and with each other.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import indicators
+
+
+def _read_only(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    if values.flags.writeable:
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
+class FeatureView:
+    """Read-only access to a price frame and the indicators derived from it."""
+
+    def __init__(self, data: pd.DataFrame, graph=None):
+        """
+        Parameters:
+            data (pd.DataFrame): Price frame; it is never modified.
+            graph (FeatureGraph): Optional graph over the same frame whose
+                nodes serve the indicators instead of indicators.py.
+        """
+        self.data = data
+        self.graph = graph
+        self.index = data.index
+        self._complete = None
+        # One Series object per source column, so an active IndicatorCache
+        # fingerprints each column once for the lifetime of the view
+        self._sources = {}
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, name):
+        return name in self.data.columns
+
+    # ---------------------------------------------------------
+    # Source Columns
+    # ---------------------------------------------------------
+    def column(self, name: str) -> np.ndarray:
+        """Read-only float64 view of a source column."""
+        return _read_only(self.data[name].to_numpy(dtype=np.float64))
+
+    __getitem__ = column
+
+    def columns(self, names, rows=slice(None)) -> np.ndarray:
+        """
+        (rows x len(names)) float64 matrix, e.g. model inputs; pass a row
+        slice to materialize one batch at a time.
+        """
+        missing = [c for c in names if c not in self.data.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        return _read_only(self.data[list(names)].iloc[rows].to_numpy(dtype=np.float64))
+
+    def complete_rows(self) -> np.ndarray:
+        """Rows without NaN in any source column (what df.dropna() would keep)."""
+        if self._complete is None:
+            self._complete = self.data.notna().all(axis=1).to_numpy()
+            self._complete.flags.writeable = False
+        return self._complete
+
+    # ---------------------------------------------------------
+    # Indicators
+    # ---------------------------------------------------------
+    def _source(self, name) -> pd.Series:
+        if name not in self._sources:
+            self._sources[name] = self.data[name]
+        return self._sources[name]
+
+    def _node(self, key) -> np.ndarray:
+        return _read_only(self.graph.evaluate(key))
+
+    def sma(self, source="Close", window=20) -> np.ndarray:
+        if self.graph is not None:
+            return self._node(self.graph.sma(source, window))
+        return _read_only(indicators.sma(self._source(source), window))
+
+    def ema(self, source="Close", window=20) -> np.ndarray:
+        if self.graph is not None:
+            return self._node(self.graph.ema(source, window))
+        return _read_only(indicators.ema(self._source(source), window))
+
+    def rsi(self, source="Close", window=14) -> np.ndarray:
+        if self.graph is not None:
+            return self._node(self.graph.rsi(source, window))
+        return _read_only(indicators.rsi(self._source(source), window))
+
+    def macd(self, source="Close", fast=12, slow=26, signal=9):
+        """Returns read-only macd_line, signal_line, histogram."""
+        if self.graph is not None:
+            return tuple(self._node(k) for k in self.graph.macd(source, fast, slow, signal))
+        return tuple(
+            _read_only(v) for v in indicators.macd(self._source(source), fast, slow, signal)
+        )
+
+
+def as_view(data) -> FeatureView:
+    """Wrap a DataFrame in a FeatureView (views are passed through)."""
+    return data if isinstance(data, FeatureView) else FeatureView(data)
+
+
+def signals_to_series(signal: np.ndarray, view: FeatureView) -> pd.Series:
+    """
+    Adapter for generate_signals(): drop the NaN rows of a compute_signals()
+    vector and return integer positions indexed like the source frame.
+    """
+    valid = ~np.isnan(signal)
+    return pd.Series(signal[valid].astype(np.int64), index=view.index[valid])
+
+
+def strategy_signals(strategy, data) -> np.ndarray:
+    """
+    Full-length float64 signal vector for any strategy, NaN where it emits
+    none; uses compute_signals() when the strategy implements it.
+    """
+    view = as_view(data)
+    if hasattr(strategy, "compute_signals"):
+        return strategy.compute_signals(view)
+    return (
+        pd.Series(strategy.generate_signals(view.data))
+        .reindex(view.index)
+        .to_numpy(dtype=np.float64)
+    )
@@ -9,7 +9,8 @@ and writes the processed dataset for model training.
 """
 
 import pandas as pd
-import ta  # Technical Analysis library
+
+from .feature_graph import FeatureGraph
 
 def main():
     # Load raw historical data
@@ -19,12 +20,14 @@ def main():
     df["timestamp"] = pd.to_datetime(df["timestamp"])
     df.sort_values("timestamp", inplace=True)
     
-    # Compute technical indicators
-    df["sma_20"] = ta.trend.sma_indicator(df["close"], window=20)
-    df["rsi_14"] = ta.momentum.RSIIndicator(df["close"], window=14).rsi()
-    df["atr_14"] = ta.volatility.AverageTrueRange(
-        df["high"], df["low"], df["close"], window=14
-    ).average_true_range()
+    # Compute technical indicators (same kernels the strategies use)
+    graph = FeatureGraph(df)
+    graph.output("sma_20", graph.sma("close", 20))
+    # Wilder-smoothed, as ta's RSIIndicator / AverageTrueRange produced them
+    graph.output("rsi_14", graph.rsi("close", 14, smoothing="wilder"))
+    graph.output("atr_14", graph.atr("high", "low", "close", window=14, smoothing="wilder"))
+    for name, values in graph.compute().items():
+        df[name] = values
     
     # Drop rows with NaNs
     df.dropna(inplace=True)
@@ -35,7 +38,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-git add src/features/build_features.py
-git commit -m "Add feature engineering module"
-git push
@@ -0,0 +1,196 @@
+"""
+feature_graph.py
+
+Module: Feature DAG Engine
+
+Strategies and the features stage declare the indicators they need as
+nodes of a FeatureGraph. Nodes are keyed on (operation, inputs,
+parameters), so identical sub-expressions -- the EMAs shared by two MACD
+configurations, the SMA inside Bollinger Bands, the true range behind
+ATR -- collapse into one node that is computed once, in dependency
+order, through the NumPy kernels in src/indicator_kernels.py.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .. import indicator_kernels as kernels
+from ..feature_view import FeatureView
+
+
+def _sub(a, b, dtype):
+    return (a - b).astype(dtype, copy=False)
+
+
+def _add_scaled(a, b, scale, dtype):
+    return (a + scale * b).astype(dtype, copy=False)
+
+
+def _percent_k(close, low_min, high_max, dtype):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (100 * (close - low_min) / (high_max - low_min)).astype(dtype, copy=False)
+
+
+# op name -> kernel(*input_arrays, *params, dtype)
+_OPS = {
+    "sma": kernels.sma,
+    "ema": kernels.ema,
+    "wilder": kernels.wilder,
+    "rsi": kernels.rsi,
+    "wilder_rsi": kernels.wilder_rsi,
+    "roc": kernels.roc,
+    "rolling_std": kernels.rolling_std,
+    "rolling_min": kernels.rolling_min,
+    "rolling_max": kernels.rolling_max,
+    "true_range": kernels.true_range,
+    "sub": _sub,
+    "add_scaled": _add_scaled,
+    "percent_k": _percent_k,
+}
+
+
+class FeatureGraph:
+    """
+    Declarative, de-duplicating indicator graph over one price frame.
+
+    Example:
+        graph = FeatureGraph(df)
+        for strategy in strategies:
+            strategy.declare_features(graph)
+        graph.output("atr_14", graph.atr(window=14))
+        features = graph.compute()
+        signals = [s.compute_signals(graph.view()) for s in strategies]
+    """
+
+    def __init__(self, data: pd.DataFrame, dtype=np.float64):
+        """
+        Parameters:
+            data (pd.DataFrame): Price frame holding the source columns.
+            dtype: Storage dtype of computed features (np.float32 halves memory).
+        """
+        self.data = data
+        self.dtype = dtype
+        self.outputs = {}
+        self.n_evaluated = 0
+        self._nodes = set()
+        self._values = {}
+
+    # ---------------------------------------------------------
+    # Node Declaration
+    # ---------------------------------------------------------
+    def node(self, op: str, *inputs, params=()):
+        """
+        Declare (or look up) a node. Inputs are column names or other node
+        keys; identical declarations return the same key.
+        """
+        if op != "column" and op not in _OPS:
+            raise ValueError(f"Unknown feature operation: {op}")
+        inputs = tuple(("column", (), (i,)) if isinstance(i, str) else i for i in inputs)
+        key = (op, inputs, tuple(params))
+        self._nodes.add(key)
+        self._nodes.update(inputs)
+        return key
+
+    def __len__(self):
+        """Number of distinct nodes declared so far."""
+        return len(self._nodes)
+
+    def sma(self, source="Close", window=20):
+        return self.node("sma", source, params=(window,))
+
+    def ema(self, source="Close", window=20):
+        return self.node("ema", source, params=(window,))
+
+    def rsi(self, source="Close", window=14, smoothing="sma"):
+        """
+        Relative Strength Index; smoothing="wilder" uses Wilder's smoothing
+        (as ta's RSIIndicator) instead of rolling means of gains and losses.
+        """
+        if smoothing not in ("sma", "wilder"):
+            raise ValueError("smoothing must be 'sma' or 'wilder'")
+        op = "rsi" if smoothing == "sma" else "wilder_rsi"
+        return self.node(op, source, params=(window,))
+
+    def roc(self, source="Close", window=10):
+        return self.node("roc", source, params=(window,))
+
+    def macd(self, source="Close", fast=12, slow=26, signal=9):
+        """Returns (macd_line, signal_line, histogram) nodes."""
+        macd_line = self.node("sub", self.ema(source, fast), self.ema(source, slow))
+        signal_line = self.node("ema", macd_line, params=(signal,))
+        return macd_line, signal_line, self.node("sub", macd_line, signal_line)
+
+    def bollinger_bands(self, source="Close", window=20, num_std=2):
+        """Returns (middle, upper, lower) nodes; the middle band is the shared SMA node."""
+        middle = self.sma(source, window)
+        std = self.node("rolling_std", source, params=(window,))
+        return (
+            middle,
+            self.node("add_scaled", middle, std, params=(num_std,)),
+            self.node("add_scaled", middle, std, params=(-num_std,)),
+        )
+
+    def true_range(self, high="High", low="Low", close="Close"):
+        return self.node("true_range", high, low, close)
+
+    def atr(self, high="High", low="Low", close="Close", window=14, smoothing="sma"):
+        """
+        Average True Range; smoothing="wilder" uses Wilder's RMA (as ta's
+        AverageTrueRange) instead of a simple moving average.
+        """
+        if smoothing not in ("sma", "wilder"):
+            raise ValueError("smoothing must be 'sma' or 'wilder'")
+        return self.node(smoothing, self.true_range(high, low, close), params=(window,))
+
+    def stochastic(self, high="High", low="Low", close="Close", k_window=14, d_window=3):
+        """Returns (%K, %D) nodes."""
+        low_min = self.node("rolling_min", low, params=(k_window,))
+        high_max = self.node("rolling_max", high, params=(k_window,))
+        percent_k = self.node("percent_k", close, low_min, high_max)
+        return percent_k, self.node("sma", percent_k, params=(d_window,))
+
+    def output(self, name: str, key):
+        """Register a node under an output name."""
+        self.outputs[name] = key
+        return key
+
+    # ---------------------------------------------------------
+    # Evaluation
+    # ---------------------------------------------------------
+    def evaluate(self, key) -> np.ndarray:
+        """Compute a node (and its inputs) once; later calls return the stored array."""
+        value = self._values.get(key)
+        if value is not None:
+            return value
+
+        op, inputs, params = key
+        if op == "column":
+            value = self.data[params[0]].to_numpy(dtype=np.float64)
+        else:
+            args = [self.evaluate(i) for i in inputs]
+            value = _OPS[op](*args, *params, dtype=self.dtype)
+            self.n_evaluated += 1
+
+        value.flags.writeable = False
+        self._values[key] = value
+        return value
+
+    def view(self) -> FeatureView:
+        """
+        FeatureView over the graph's frame whose indicators are read from
+        this graph, so strategy.compute_signals(graph.view()) reuses the
+        nodes declared by the features stage and by declare_features().
+        """
+        return FeatureView(self.data, graph=self)
+
+    def compute(self) -> dict:
+        """
+        Evaluate every registered output.
+
+        Returns:
+            dict: output name -> read-only pd.Series view over the node's array.
+        """
+        return {
+            name: pd.Series(self.evaluate(key), index=self.data.index, name=name, copy=False)
+            for name, key in self.outputs.items()
+        }
@@ -0,0 +1,210 @@
+import functools
+import hashlib
+import inspect
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+# Under copy-on-write a shallow copy is enough to isolate callers
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+
+def _detach(value):
+    """A copy of a cached value that the caller may modify freely."""
+    if isinstance(value, tuple):
+        return tuple(_detach(v) for v in value)
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.copy(deep=not _COPY_ON_WRITE)
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    return value
+
+
+class IndicatorCache:
+    """
+    Memory-bounded LRU cache for indicator outputs.
+
+    Entries are keyed on (indicator name, fingerprint of the input
+    series/frame including its index, parameters), so any strategy asking
+    for an indicator that was already computed on the same data gets the
+    stored result back, e.g. the 50-bar SMA shared by every fast window
+    in an SMAStrategy sweep, or the EMAs inside macd().
+
+    Every caller gets its own copy of a cached result (an O(1) shallow
+    copy under pandas copy-on-write), so editing a returned series never
+    changes what later hits see.
+
+    Input fingerprints are memoized per live input object, so repeated
+    lookups on the same series (e.g. the columns of one FeatureView)
+    hash it only once; inputs must not be modified in place while they
+    are being passed to memoized indicators.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024**2):
+        """
+        Parameters:
+            max_bytes (int): Memory budget for cached results.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # (id(input), columns) -> (weakref to input, fingerprint)
+        self._fingerprints = {}
+
+    # ---------------------------------------------------------
+    # Fingerprinting
+    # ---------------------------------------------------------
+    @staticmethod
+    def _update_index(h, index: pd.Index):
+        if isinstance(index, pd.RangeIndex):
+            h.update(repr((index.start, index.stop, index.step)).encode())
+        elif index.dtype.kind in "biufmM":
+            h.update(np.ascontiguousarray(index.to_numpy()).data)
+        else:
+            h.update(repr(tuple(index)).encode())
+
+    @classmethod
+    def fingerprint(cls, obj, columns=None) -> str:
+        """Content hash of a Series / DataFrame (selected columns) / ndarray."""
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(obj, pd.DataFrame):
+            cols = list(columns) if columns is not None else list(obj.columns)
+            h.update(repr(cols).encode())
+            cls._update_index(h, obj.index)
+            for c in cols:
+                h.update(np.ascontiguousarray(obj[c].to_numpy(dtype=np.float64)).data)
+        elif isinstance(obj, pd.Series):
+            cls._update_index(h, obj.index)
+            h.update(np.ascontiguousarray(obj.to_numpy(dtype=np.float64)).data)
+        else:
+            arr = np.ascontiguousarray(obj)
+            h.update(repr((arr.dtype.str, arr.shape)).encode())
+            h.update(arr.data)
+        return h.hexdigest()
+
+    def fingerprint_of(self, obj, columns=None) -> str:
+        """fingerprint() of obj, computed once while obj is alive."""
+        key = (id(obj), None if columns is None else tuple(columns))
+        entry = self._fingerprints.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+
+        digest = self.fingerprint(obj, columns)
+        try:
+            ref = weakref.ref(obj, lambda _, key=key, memo=self._fingerprints: memo.pop(key, None))
+        except TypeError:
+            # Not weak-referenceable: hash on every lookup
+            return digest
+        self._fingerprints[key] = (ref, digest)
+        return digest
+
+    # ---------------------------------------------------------
+    # Lookup / Store
+    # ---------------------------------------------------------
+    @staticmethod
+    def _sizeof(value) -> int:
+        if isinstance(value, tuple):
+            return sum(IndicatorCache._sizeof(v) for v in value)
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=False).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=False))
+        return int(getattr(value, "nbytes", 0))
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _detach(value[0])
+
+        self.misses += 1
+        result = compute()
+        size = self._sizeof(result)
+        if size <= self.max_bytes:
+            self._entries[key] = (result, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+            return _detach(result)
+        return result
+
+    def clear(self):
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._fingerprints.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ---------------------------------------------------------
+# Active Cache (opt-in, process wide)
+# ---------------------------------------------------------
+_ACTIVE = None
+
+
+def set_cache(cache):
+    """Activate a cache for all memoized indicators (None disables caching)."""
+    global _ACTIVE
+    _ACTIVE = cache
+
+
+def get_cache():
+    """Return the active IndicatorCache, or None."""
+    return _ACTIVE
+
+
+@contextmanager
+def use_cache(cache=None):
+    """
+    Enable indicator memoization inside a with-block.
+
+    Example:
+        with use_cache(IndicatorCache(max_bytes=512 * 1024**2)):
+            for fast in range(5, 50):
+                SMAStrategy(fast, 50).generate_signals(df)
+    """
+    previous = _ACTIVE
+    set_cache(cache if cache is not None else IndicatorCache())
+    try:
+        yield _ACTIVE
+    finally:
+        set_cache(previous)
+
+
+def memoized(columns=None):
+    """
+    Decorator for indicator functions whose first argument is the input
+    series (or frame; `columns` lists the frame columns the indicator
+    reads). A no-op pass-through while no cache is active.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(data, *args, **kwargs):
+            cache = _ACTIVE
+            if cache is None:
+                return func(data, *args, **kwargs)
+
+            # Normalise positional / keyword / default parameters
+            bound = signature.bind(data, *args, **kwargs)
+            bound.apply_defaults()
+            params = tuple(list(bound.arguments.items())[1:])
+
+            key = (func.__name__, cache.fingerprint_of(data, columns), params)
+            return cache.get_or_compute(key, lambda: func(data, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,412 @@
+"""
+NumPy-native indicator kernels.
+
+ndarray in, ndarray out: the pandas functions in indicators.py are thin
+wrappers over these, and inner loops (sweeps, panels, streaming replays)
+can call them directly to skip pandas overhead.
+
+Kernels accept a 1D series or a 2D (bars x columns) panel: windows and
+recurrences run along axis 0, and the compiled loops iterate over the
+columns themselves, so a panel is one kernel call rather than one per
+asset.
+
+Every kernel takes a `dtype` switch for its result only: inputs are
+upcast and all intermediates (sums, recurrences) are computed in float64
+for precision, so float32 halves the size of the feature arrays that are
+kept, not the peak memory of the computation itself.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the EMA recurrence falls back to pandas
+    njit = None
+
+
+def _as_float(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _columns(values) -> np.ndarray:
+    """
+    2D column-major view for the compiled loops: a 1D series becomes one
+    column (a view, so writes land in the caller's array), and panels are
+    laid out so that each column is contiguous.
+    """
+    return values[:, None] if values.ndim == 1 else np.asfortranarray(values)
+
+
+def _nan_like(values) -> np.ndarray:
+    return np.full(values.shape, np.nan, order="F")
+
+
+# ---------------------------------------------------------
+# ROLLING WINDOW PRIMITIVES
+# ---------------------------------------------------------
+
+def _rolling_sum_prefix(values, window, out):
+    # NumPy fallback: one cumulative-sum prefix per column, centred for
+    # precision, with NaN/inf counted in separate prefixes so they cannot
+    # poison it
+    n, m = values.shape
+    finite = np.isfinite(values)
+    first = values[np.argmax(finite, axis=0), np.arange(m)]
+    shift = np.where(finite.any(axis=0), first, 0.0)
+    centred = np.where(finite, values - shift, 0.0)
+
+    csum = np.concatenate((np.zeros((1, m)), np.cumsum(centred, axis=0)))
+    out[window - 1:] = csum[window:] - csum[:-window] + window * shift
+
+    if not finite.all():
+        def window_count(mask):
+            c = np.concatenate((np.zeros((1, m), dtype=np.int64), np.cumsum(mask, axis=0)))
+            hits = np.zeros((n, m), dtype=bool)
+            hits[window - 1:] = c[window:] > c[:-window]
+            return hits
+
+        pos, neg = window_count(values == np.inf), window_count(values == -np.inf)
+        out[pos] = np.inf
+        out[neg] = -np.inf
+        out[(pos & neg) | window_count(np.isnan(values))] = np.nan
+    return out
+
+
+def _rolling_sum_loop(values, window, out):
+    # Single pass per column with add/remove updates and Kahan compensation
+    for col in range(values.shape[1]):
+        total = 0.0
+        comp = 0.0
+        n_nan = 0
+        n_pos_inf = 0
+        n_neg_inf = 0
+        for i in range(values.shape[0]):
+            for sign in (1, -1):
+                j = i if sign == 1 else i - window
+                if j < 0:
+                    continue
+                x = values[j, col]
+                if x != x:
+                    n_nan += sign
+                elif x == np.inf:
+                    n_pos_inf += sign
+                elif x == -np.inf:
+                    n_neg_inf += sign
+                else:
+                    y = sign * x - comp
+                    t = total + y
+                    comp = (t - total) - y
+                    total = t
+
+            if i < window - 1 or n_nan > 0 or (n_pos_inf > 0 and n_neg_inf > 0):
+                out[i, col] = np.nan
+            elif n_pos_inf > 0:
+                out[i, col] = np.inf
+            elif n_neg_inf > 0:
+                out[i, col] = -np.inf
+            else:
+                out[i, col] = total
+    return out
+
+
+if njit is not None:
+    _rolling_sum_loop = njit(cache=True, nogil=True)(_rolling_sum_loop)
+
+
+def rolling_sum(values, window: int) -> np.ndarray:
+    """
+    Rolling sum over `window` bars; NaN until the window is full or while
+    it contains a NaN (pandas rolling min_periods=window semantics).
+    """
+    values = _as_float(values)
+    out = _nan_like(values)
+    if window > len(values):
+        return out
+    if njit is None:
+        _rolling_sum_prefix(_columns(values), window, _columns(out))
+    else:
+        _rolling_sum_loop(_columns(values), window, _columns(out))
+    return out
+
+
+def rolling_mean(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Rolling mean (NaN until the window is full)."""
+    out = rolling_sum(values, window)
+    out /= window
+    return out.astype(dtype, copy=False)
+
+
+def _rolling_std_loop(values, window, out):
+    # Sliding Welford add/remove updates over full windows, per column.
+    # The moments are re-derived with a two-pass sweep of the window
+    # whenever a NaN/inf has just left it and once every `window` bars, so
+    # rounding error cannot build up on long or trending series.
+    for col in range(values.shape[1]):
+        n_bad = 0
+        mean = 0.0
+        m2 = 0.0
+        stale = True
+        since = 0
+        for i in range(values.shape[0]):
+            x = values[i, col]
+            if not np.isfinite(x):
+                n_bad += 1
+            old = 0.0
+            if i >= window:
+                old = values[i - window, col]
+                if not np.isfinite(old):
+                    n_bad -= 1
+
+            if i < window - 1 or n_bad > 0:
+                out[i, col] = np.nan
+                stale = True
+                continue
+
+            since += 1
+            if stale or since >= window:
+                total = 0.0
+                for j in range(i - window + 1, i + 1):
+                    total += values[j, col]
+                mean = total / window
+                m2 = 0.0
+                for j in range(i - window + 1, i + 1):
+                    d = values[j, col] - mean
+                    m2 += d * d
+                stale = False
+                since = 0
+            else:
+                old_mean = mean
+                mean += (x - old) / window
+                m2 += (x - old) * (x - mean + old - old_mean)
+
+            out[i, col] = np.sqrt(max(m2, 0.0) / (window - 1))
+    return out
+
+
+if njit is not None:
+    _rolling_std_loop = njit(cache=True, nogil=True)(_rolling_std_loop)
+
+
+def rolling_std(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1)."""
+    values = _as_float(values)
+    if window < 2 or window > len(values):
+        return _nan_like(values).astype(dtype, copy=False)
+
+    if njit is None:
+        import pandas as pd
+
+        out = pd.DataFrame(_columns(values)).rolling(window).std().to_numpy(copy=True)
+        out = out.reshape(values.shape)
+    else:
+        out = _nan_like(values)
+        _rolling_std_loop(_columns(values), window, _columns(out))
+    return out.astype(dtype, copy=False)
+
+
+def rolling_min(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Rolling minimum (NaN if the window contains NaN)."""
+    return _rolling_extreme(values, window, np.min, dtype)
+
+
+def rolling_max(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Rolling maximum (NaN if the window contains NaN)."""
+    return _rolling_extreme(values, window, np.max, dtype)
+
+
+def _rolling_extreme(values, window, reduce, dtype):
+    values = _as_float(values)
+    out = np.full(values.shape, np.nan, dtype=dtype, order="F")
+    if window <= len(values):
+        view = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        out[window - 1:] = reduce(view, axis=-1)
+    return out
+
+
+# ---------------------------------------------------------
+# MOVING AVERAGES
+# ---------------------------------------------------------
+
+def sma(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Simple Moving Average."""
+    return rolling_mean(values, window, dtype)
+
+
+def _ema_loop(values, alpha, out):
+    # Port of pandas' ewma (adjust=False, ignore_na=False, min_periods=0),
+    # run down each column
+    if values.shape[0] == 0:
+        return out
+    for col in range(values.shape[1]):
+        weighted = values[0, col]
+        out[0, col] = weighted
+        old_wt = 1.0
+        for i in range(1, values.shape[0]):
+            cur = values[i, col]
+            if weighted == weighted:
+                old_wt *= 1.0 - alpha
+                if cur == cur:
+                    if weighted != cur:
+                        weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                    old_wt = 1.0
+            elif cur == cur:
+                weighted = cur
+            out[i, col] = weighted
+    return out
+
+
+if njit is not None:
+    _ema_loop = njit(cache=True, nogil=True)(_ema_loop)
+
+
+def _ewm(values, alpha):
+    """adjust=False exponential smoothing with factor alpha (float64)."""
+    if njit is None:
+        import pandas as pd
+
+        out = pd.DataFrame(_columns(values)).ewm(alpha=alpha, adjust=False).mean()
+        return out.to_numpy(copy=True).reshape(values.shape)
+    out = _nan_like(values)
+    _ema_loop(_columns(values), alpha, _columns(out))
+    return out
+
+
+def ema(values, window: int, dtype=np.float64) -> np.ndarray:
+    """Exponential Moving Average (span-based, adjust=False)."""
+    values = _as_float(values)
+    if len(values) == 0:
+        return values.astype(dtype)
+    return _ewm(values, 2.0 / (window + 1.0)).astype(dtype, copy=False)
+
+
+def wilder(values, window: int, dtype=np.float64) -> np.ndarray:
+    """
+    Wilder's smoothing (RMA): seeded with the mean of the first `window`
+    values, then out[t] = (out[t-1] * (window - 1) + x[t]) / window, i.e.
+    an EMA with alpha = 1/window. NaN during the warm-up.
+    """
+    values = _as_float(values)
+    out = _nan_like(values)
+    if 0 < window <= len(values):
+        seeded = values[window - 1:].copy()
+        seeded[0] = values[:window].mean(axis=0)
+        out[window - 1:] = _ewm(seeded, 1.0 / window)
+    return out.astype(dtype, copy=False)
+
+
+# ---------------------------------------------------------
+# RSI
+# ---------------------------------------------------------
+
+def rsi(values, window: int = 14, dtype=np.float64) -> np.ndarray:
+    """Relative Strength Index (rolling-mean smoothing)."""
+    delta = np.diff(_as_float(values), axis=0, prepend=np.nan)
+
+    # clip() keeps the leading NaN, as Series.clip does
+    gain_sums = rolling_sum(np.clip(delta, 0, None), window)
+    loss_sums = rolling_sum(np.clip(-delta, 0, None), window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100 - (100 / (1 + gain_sums / loss_sums))
+    return out.astype(dtype, copy=False)
+
+
+def wilder_rsi(values, window: int = 14, dtype=np.float64) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder's smoothing (as ta's RSIIndicator):
+    gains and losses are smoothed with alpha = 1/window from the first bar,
+    the first window - 1 bars are NaN, and bars without losses read 100.
+    """
+    delta = np.diff(_as_float(values), axis=0, prepend=np.nan)
+
+    # Missing deltas count as no move, as in ta
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    avg_gain = _ewm(gains, 1.0 / window)
+    avg_loss = _ewm(losses, 1.0 / window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    out[:window - 1] = np.nan
+    return out.astype(dtype, copy=False)
+
+
+# ---------------------------------------------------------
+# MACD
+# ---------------------------------------------------------
+
+def macd(values, fast=12, slow=26, signal=9, dtype=np.float64):
+    """Returns macd_line, signal_line, histogram."""
+    macd_line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(macd_line, signal)
+    histogram = macd_line - signal_line
+    return (
+        macd_line.astype(dtype, copy=False),
+        signal_line.astype(dtype, copy=False),
+        histogram.astype(dtype, copy=False),
+    )
+
+
+# ---------------------------------------------------------
+# BOLLINGER BANDS
+# ---------------------------------------------------------
+
+def bollinger_bands(values, window=20, num_std=2, dtype=np.float64):
+    """Returns middle_band, upper_band, lower_band."""
+    middle = rolling_mean(values, window)
+    std = rolling_std(values, window)
+    return (
+        middle.astype(dtype, copy=False),
+        (middle + num_std * std).astype(dtype, copy=False),
+        (middle - num_std * std).astype(dtype, copy=False),
+    )
+
+
+# ---------------------------------------------------------
+# ATR - Average True Range
+# ---------------------------------------------------------
+
+def true_range(high, low, close, dtype=np.float64) -> np.ndarray:
+    """Row-wise max of High-Low, |High-prev Close|, |Low-prev Close| (NaN-skipping)."""
+    high, low, close = _as_float(high), _as_float(low), _as_float(close)
+    prev_close = np.concatenate((np.full_like(close[:1], np.nan), close[:-1]))
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return tr.astype(dtype, copy=False)
+
+
+def atr(high, low, close, window=14, dtype=np.float64) -> np.ndarray:
+    """Average True Range (simple moving average of the true range)."""
+    return rolling_mean(true_range(high, low, close), window, dtype)
+
+
+def wilder_atr(high, low, close, window=14, dtype=np.float64) -> np.ndarray:
+    """Average True Range with Wilder's smoothing (as ta's AverageTrueRange)."""
+    return wilder(true_range(high, low, close), window, dtype)
+
+
+# ---------------------------------------------------------
+# ROC - Rate of Change
+# ---------------------------------------------------------
+
+def roc(values, window=10, dtype=np.float64) -> np.ndarray:
+    """Rate of Change."""
+    values = _as_float(values)
+    out = _nan_like(values)
+    if window < len(values):
+        out[window:] = values[window:] / values[:-window] - 1
+    return out.astype(dtype, copy=False)
+
+
+# ---------------------------------------------------------
+# STOCHASTIC OSCILLATOR
+# ---------------------------------------------------------
+
+def stochastic(high, low, close, k_window=14, d_window=3, dtype=np.float64):
+    """Returns %K, %D."""
+    low_min = rolling_min(low, k_window)
+    high_max = rolling_max(high, k_window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_k = 100 * (_as_float(close) - low_min) / (high_max - low_min)
+    percent_d = rolling_mean(percent_k, d_window)
+    return percent_k.astype(dtype, copy=False), percent_d.astype(dtype, copy=False)
@@ -1,51 +1,55 @@
 import numpy as np
 import pandas as pd
 
+from . import indicator_kernels as kernels
+from .indicator_cache import memoized
+
+# The functions below are thin pandas wrappers over the ndarray kernels in
+# indicator_kernels.py (which also offer a float32 dtype switch).
+
+
+def _wrap(values, like: pd.Series) -> pd.Series:
+    return pd.Series(values, index=like.index, name=like.name)
+
 
 # ---------------------------------------------------------
 # MOVING AVERAGES
 # ---------------------------------------------------------
 
+@memoized()
 def sma(series: pd.Series, window: int) -> pd.Series:
     """Simple Moving Average."""
-    return series.rolling(window).mean()
+    return _wrap(kernels.sma(series.to_numpy(), window), series)
 
 
+@memoized()
 def ema(series: pd.Series, window: int) -> pd.Series:
     """Exponential Moving Average."""
-    return series.ewm(span=window, adjust=False).mean()
+    return _wrap(kernels.ema(series.to_numpy(), window), series)
 
 
 # ---------------------------------------------------------
 # RSI
 # ---------------------------------------------------------
 
+@memoized()
 def rsi(series: pd.Series, window: int = 14) -> pd.Series:
     """Relative Strength Index (RSI)."""
-    delta = series.diff()
-
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    avg_gain = gain.rolling(window).mean()
-    avg_loss = loss.rolling(window).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    return rsi
+    return _wrap(kernels.rsi(series.to_numpy(), window), series)
 
 
 # ---------------------------------------------------------
 # MACD
 # ---------------------------------------------------------
 
+@memoized()
 def macd(series: pd.Series, fast=12, slow=26, signal=9):
     """
     MACD = EMA(fast) - EMA(slow)
     Signal = EMA(MACD, signal)
     Histogram = MACD - Signal
     """
+    # Built from the public ema() so an active IndicatorCache shares the EMAs
     ema_fast = ema(series, fast)
     ema_slow = ema(series, slow)
 
@@ -60,13 +64,14 @@ def macd(series: pd.Series, fast=12, slow=26, signal=9):
 # BOLLINGER BANDS
 # ---------------------------------------------------------
 
+@memoized()
 def bollinger_bands(series: pd.Series, window=20, num_std=2):
     """
     Returns:
         middle_band, upper_band, lower_band
     """
     sma_val = sma(series, window)
-    std = series.rolling(window).std()
+    std = _wrap(kernels.rolling_std(series.to_numpy(), window), series)
 
     upper_band = sma_val + num_std * std
     lower_band = sma_val - num_std * std
@@ -78,41 +83,131 @@ def bollinger_bands(series: pd.Series, window=20, num_std=2):
 # ATR - Average True Range
 # ---------------------------------------------------------
 
+@memoized(columns=("High", "Low", "Close"))
 def atr(df: pd.DataFrame, window=14):
     """
     Average True Range requires:
     High, Low, Close columns.
     """
-    high_low = df["High"] - df["Low"]
-    high_close = np.abs(df["High"] - df["Close"].shift())
-    low_close = np.abs(df["Low"] - df["Close"].shift())
-
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return true_range.rolling(window).mean()
+    values = kernels.atr(df["High"].to_numpy(), df["Low"].to_numpy(), df["Close"].to_numpy(), window)
+    return pd.Series(values, index=df.index)
 
 
 # ---------------------------------------------------------
 # ROC - Rate of Change
 # ---------------------------------------------------------
 
+@memoized()
 def roc(series: pd.Series, window=10):
     """Rate of Change."""
-    return series.pct_change(periods=window)
+    return _wrap(kernels.roc(series.to_numpy(), window), series)
 
 
 # ---------------------------------------------------------
 # STOCHASTIC OSCILLATOR
 # ---------------------------------------------------------
 
+@memoized(columns=("High", "Low", "Close"))
 def stochastic(df: pd.DataFrame, k_window=14, d_window=3):
     """
     Returns:
         %K, %D stochastic oscillator values
     """
-    low_min = df["Low"].rolling(k_window).min()
-    high_max = df["High"].rolling(k_window).max()
+    percent_k, percent_d = kernels.stochastic(
+        df["High"].to_numpy(), df["Low"].to_numpy(), df["Close"].to_numpy(), k_window, d_window
+    )
+    return pd.Series(percent_k, index=df.index), pd.Series(percent_d, index=df.index)
+
+
+# ---------------------------------------------------------
+# MULTI-WINDOW (BATCHED) INDICATORS
+# ---------------------------------------------------------
+# Each takes a list of windows and returns a (bars x windows) float array,
+# matching the single-window function column by column.
+
+def _rolling_sums(values: np.ndarray, windows) -> tuple:
+    """
+    Rolling sums for every window from one shared cumulative-sum prefix.
+
+    Returns (sums, complete) where complete marks rows whose window is
+    full and NaN-free (min_periods=window semantics of pandas rolling).
+    """
+    n = len(values)
+    nan = np.isnan(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(nan, 0.0, values))))
+    cnan = np.concatenate(([0], np.cumsum(nan)))
+
+    sums = np.full((n, len(windows)), np.nan, order="F")
+    complete = np.zeros((n, len(windows)), dtype=bool, order="F")
+    for j, w in enumerate(windows):
+        if w > n:
+            continue
+        np.subtract(csum[w:], csum[:-w], out=sums[w - 1:, j])
+        np.equal(cnan[w:], cnan[:-w], out=complete[w - 1:, j])
+    return sums, complete
+
+
+def sma_multi(series, windows) -> np.ndarray:
+    """Simple Moving Average for many windows at once."""
+    values = np.asarray(series, dtype=np.float64)
+    sums, complete = _rolling_sums(values, windows)
+    return np.where(complete, sums / np.asarray(windows, dtype=np.float64), np.nan)
+
+
+def ema_multi(series, windows) -> np.ndarray:
+    """
+    Exponential Moving Average (span, adjust=False) for many windows at once.
+
+    Each column is one call to the compiled single-window EMA kernel (a
+    bar-by-bar recurrence cannot be shared across windows any cheaper).
+    """
+    values = np.asarray(series, dtype=np.float64)
+    out = np.empty((len(values), len(windows)), order="F")
+    for j, w in enumerate(windows):
+        out[:, j] = kernels.ema(values, w)
+    return out
+
+
+def rsi_multi(series, windows) -> np.ndarray:
+    """Relative Strength Index for many windows at once (same smoothing as rsi())."""
+    values = np.asarray(series, dtype=np.float64)
+    delta = np.diff(values, prepend=np.nan)
+
+    # clip() keeps the leading NaN, as in rsi()
+    gain_sums, complete = _rolling_sums(np.clip(delta, 0, None), windows)
+    loss_sums, _ = _rolling_sums(np.clip(-delta, 0, None), windows)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = gain_sums / loss_sums
+        out = 100 - (100 / (1 + rs))
+    return np.where(complete, out, np.nan)
+
+
+def bollinger_bands_multi(series, windows, num_std=2) -> tuple:
+    """
+    Bollinger Bands for many windows at once.
+
+    The middle bands share one cumulative-sum prefix; the standard
+    deviations use the numerically stable rolling_std kernel per window.
+
+    Returns:
+        middle_band, upper_band, lower_band as (bars x windows) arrays
+    """
+    values = np.asarray(series, dtype=np.float64)
+    middle = sma_multi(values, windows)
+
+    std = np.empty_like(middle)
+    for j, w in enumerate(windows):
+        std[:, j] = kernels.rolling_std(values, w)
+    return middle, middle + num_std * std, middle - num_std * std
+
 
-    percent_k = 100 * (df["Close"] - low_min) / (high_max - low_min)
-    percent_d = percent_k.rolling(d_window).mean()
+def roc_multi(series, windows) -> np.ndarray:
+    """Rate of Change for many windows at once."""
+    values = np.asarray(series, dtype=np.float64)
+    w = np.asarray(windows, dtype=np.int64)
 
-    return percent_k, percent_d
+    idx = np.arange(len(values))[:, None]
+    past = idx - w[None, :]
+    prev = np.where(past >= 0, values[np.maximum(past, 0)], np.nan)
+    return values[:, None] / prev - 1
@@ -106,23 +106,210 @@ class Metrics:
             / self.returns.rolling(window).std()
         ) * np.sqrt(self.trading_days)
 
+    # ---------------------------------------------------------
+    # Bootstrap Confidence Intervals
+    # ---------------------------------------------------------
+    @staticmethod
+    def _resampled_metrics(paths: np.ndarray, trading_days: int) -> dict:
+        """
+        Sharpe, Sortino, Max Drawdown and CAGR for each row of a
+        (resamples x bars) return matrix, using the same definitions as
+        the single-series methods above.
+        """
+        n = paths.shape[1]
+        mean = paths.mean(axis=1)
+        std = paths.std(axis=1)
+
+        neg = np.where(paths < 0, paths, 0.0)
+        n_neg = (paths < 0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            neg_mean = neg.sum(axis=1) / n_neg
+            downside = np.sqrt(np.maximum((neg ** 2).sum(axis=1) / n_neg - neg_mean ** 2, 0.0))
+            sharpe = np.where(std > 0, mean / std, 0.0)
+            sortino = np.where(
+                (n_neg > 0) & (downside > 0), np.sqrt(trading_days) * mean / downside, 0.0
+            )
+
+        equity = np.cumprod(1 + paths, axis=1)
+        roll_max = np.maximum.accumulate(equity, axis=1)
+        max_dd = ((equity - roll_max) / roll_max).min(axis=1)
+
+        total = equity[:, -1] / equity[:, 0]
+        years = n / trading_days
+        with np.errstate(invalid="ignore"):
+            cagr = np.where(total > 0, np.abs(total) ** (1 / years) - 1, -1.0)
+
+        return {
+            "Sharpe Ratio": sharpe,
+            "Sortino Ratio": sortino,
+            "Max Drawdown": max_dd,
+            "CAGR": cagr,
+        }
+
+    def bootstrap(
+        self,
+        n_resamples: int = 10_000,
+        block_size: int = 20,
+        confidence: float = 0.95,
+        chunk_size: int = 1_000,
+        seed=None,
+    ) -> pd.DataFrame:
+        """
+        Circular block-bootstrap confidence intervals for Sharpe, Sortino,
+        Max Drawdown and CAGR.
+
+        Resample indices are drawn in bulk and the metrics are evaluated
+        over a (resamples x bars) matrix, chunk_size rows at a time so
+        memory stays bounded. Passing the same seed reproduces the result.
+
+        Parameters:
+            n_resamples (int): Number of bootstrap paths.
+            block_size (int): Length of contiguous return blocks (preserves
+                autocorrelation / volatility clustering).
+            confidence (float): Two-sided confidence level.
+            chunk_size (int): Paths evaluated per vectorized pass.
+            seed: Seed or np.random.Generator for reproducibility.
+
+        Returns:
+            pd.DataFrame: Estimate / Lower / Upper per metric.
+        """
+        returns = pd.Series(self.returns).dropna().to_numpy(dtype=np.float64)
+        n = len(returns)
+        if n < 2:
+            raise ValueError("Need at least two returns to bootstrap.")
+
+        rng = np.random.default_rng(seed)
+        block_size = max(1, min(block_size, n))
+        n_blocks = -(-n // block_size)
+        offsets = np.arange(block_size)
+
+        samples = {name: [] for name in ("Sharpe Ratio", "Sortino Ratio", "Max Drawdown", "CAGR")}
+        for start in range(0, n_resamples, chunk_size):
+            size = min(chunk_size, n_resamples - start)
+            starts = rng.integers(0, n, size=(size, n_blocks))
+            idx = ((starts[:, :, None] + offsets) % n).reshape(size, -1)[:, :n]
+            for name, values in self._resampled_metrics(returns[idx], self.trading_days).items():
+                samples[name].append(values)
+
+        alpha = (1 - confidence) / 2
+        estimates = {
+            "Sharpe Ratio": self.sharpe(),
+            "Sortino Ratio": self.sortino(),
+            "Max Drawdown": self.max_drawdown(),
+            "CAGR": self.cagr(),
+        }
+        rows = {}
+        for name, chunks in samples.items():
+            values = np.concatenate(chunks)
+            rows[name] = {
+                "Estimate": estimates[name],
+                "Lower": np.quantile(values, alpha),
+                "Upper": np.quantile(values, 1 - alpha),
+            }
+        return pd.DataFrame(rows).T
+
+    # ---------------------------------------------------------
+    # Fused Kernel (one pass of shared intermediates, many series)
+    # ---------------------------------------------------------
+    @staticmethod
+    def _fused_metrics(returns: np.ndarray, equity: np.ndarray, trading_days: int) -> dict:
+        """
+        Every compute_all() statistic for each column of (bars x series)
+        returns/equity matrices. Counts, sums, moments, win/loss
+        partitions and the running max are computed once and shared, and
+        NaN bars are skipped exactly as the pandas-based methods skip them.
+        """
+        valid = ~np.isnan(returns)
+        count = valid.sum(axis=0)
+        r = np.where(valid, returns, 0.0)
+
+        pos = r > 0
+        neg = r < 0
+        n_win = pos.sum(axis=0)
+        n_loss = neg.sum(axis=0)
+        gross_profit = np.where(pos, r, 0.0).sum(axis=0)
+        gross_loss = np.where(neg, r, 0.0).sum(axis=0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = r.sum(axis=0) / count
+            var = np.where(valid, (r - mean) ** 2, 0.0).sum(axis=0) / count
+
+            loss_mean = gross_loss / n_loss
+            downside = np.sqrt(
+                np.where(neg, (r - loss_mean) ** 2, 0.0).sum(axis=0) / n_loss
+            )
+            win_mean = gross_profit / n_win
+
+            vol = np.sqrt(var) * np.sqrt(trading_days)
+            sharpe = np.where(vol > 0, np.sqrt(trading_days) * mean / vol, 0.0)
+            sortino = np.where(downside > 0, np.sqrt(trading_days) * mean / downside, 0.0)
+
+            # Drawdown from the running max (NaN equity bars are skipped)
+            roll_max = np.fmax.accumulate(equity, axis=0)
+            max_dd = np.nanmin((equity - roll_max) / roll_max, axis=0)
+
+            total = equity[-1] / equity[0]
+            years = len(equity) / trading_days
+            cagr = np.where(total > 0, np.abs(total) ** (1 / years) - 1, -1.0)
+
+            mdd = np.abs(max_dd)
+            calmar = np.where(mdd > 0, cagr / mdd, 0.0)
+
+            average_win = np.where(n_win > 0, win_mean, 0.0)
+            average_loss = np.where(n_loss > 0, loss_mean, 0.0)
+            win_rate = np.where(n_win + n_loss > 0, n_win / (n_win + n_loss), 0.0)
+            profit_factor = np.where(gross_loss < 0, gross_profit / -gross_loss, np.inf)
+            payoff = np.where(average_loss < 0, average_win / -average_loss, np.inf)
+
+        return {
+            "CAGR": cagr,
+            "Volatility": vol,
+            "Sharpe Ratio": sharpe,
+            "Sortino Ratio": sortino,
+            "Max Drawdown": max_dd,
+            "Calmar Ratio": calmar,
+            "Win Rate": win_rate,
+            "Profit Factor": profit_factor,
+            "Expectancy": mean,
+            "Average Win": average_win,
+            "Average Loss": average_loss,
+            "Payoff Ratio": payoff,
+        }
+
+    @staticmethod
+    def compute_batch(returns, equity, trading_days: int = 252) -> pd.DataFrame:
+        """
+        Score many return/equity series at once.
+
+        Parameters:
+            returns (array-like): (bars x series) net returns, e.g. the
+                "Net_Returns" array from Backtester.run_batch().
+            equity (array-like): (bars x series) equity curves.
+            trading_days (int): Annualization factor.
+
+        Returns:
+            pd.DataFrame: One row per series, one column per compute_all() metric.
+        """
+        index = returns.columns if isinstance(returns, pd.DataFrame) else None
+
+        r = np.asarray(returns, dtype=np.float64)
+        e = np.asarray(equity, dtype=np.float64)
+        if r.ndim == 1:
+            r, e = r[:, None], e[:, None]
+        if r.shape != e.shape:
+            raise ValueError(f"returns {r.shape} and equity {e.shape} must have the same shape")
+
+        return pd.DataFrame(Metrics._fused_metrics(r, e, trading_days), index=index)
+
     # ---------------------------------------------------------
     # Output Dictionary
     # ---------------------------------------------------------
     def compute_all(self):
         """Return all metrics in a dictionary (for MLFlow, logging, printing)."""
 
-        return {
-            "CAGR": round(self.cagr(), 6),
-            "Volatility": round(self.volatility(), 6),
-            "Sharpe Ratio": round(self.sharpe(), 6),
-            "Sortino Ratio": round(self.sortino(), 6),
-            "Max Drawdown": round(self.max_drawdown(), 6),
-            "Calmar Ratio": round(self.calmar(), 6),
-            "Win Rate": round(self.win_rate(), 6),
-            "Profit Factor": round(self.profit_factor(), 6),
-            "Expectancy": round(self.expectancy(), 6),
-            "Average Win": round(self.average_win(), 6),
-            "Average Loss": round(self.average_loss(), 6),
-            "Payoff Ratio": round(self.payoff_ratio(), 6),
-        }
+        fused = self._fused_metrics(
+            np.asarray(self.returns, dtype=np.float64)[:, None],
+            np.asarray(self.equity, dtype=np.float64)[:, None],
+            self.trading_days,
+        )
+        return {name: round(float(values[0]), 6) for name, values in fused.items()}
@@ -0,0 +1,158 @@
+"""
+Panel (time x asset) indicators and rule signals.
+
+Every function takes aligned 2D price matrices -- one column per asset,
+as a DataFrame or ndarray -- and passes the whole panel to the kernels of
+indicator_kernels.py, whose compiled loops run down each column, so
+panels and single series share one (compiled, numerically stable)
+implementation without a Python loop over assets.
+
+Missing data is handled per column: names that list late start their
+warm-up at their first price, names that delist (or have gaps) produce
+NaN wherever their price is NaN, and signals are NaN there too, which
+Backtester-style PnL treats as flat.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import indicator_kernels as kernels
+
+
+def _unwrap(panel):
+    """Return (column-major float64 2D array, (index, columns) or None)."""
+    if isinstance(panel, pd.DataFrame):
+        values, labels = panel.to_numpy(dtype=np.float64), (panel.index, panel.columns)
+    else:
+        values, labels = np.asarray(panel, dtype=np.float64), None
+        if values.ndim == 1:
+            values = values[:, None]
+    # Columns are contiguous, so the kernels read each asset in place
+    return np.asfortranarray(values), labels
+
+
+def _wrap(values, labels, dtype):
+    values = values.astype(dtype, copy=False)
+    if labels is None:
+        return values
+    return pd.DataFrame(values, index=labels[0], columns=labels[1], copy=False)
+
+
+# ---------------------------------------------------------
+# MOVING AVERAGES
+# ---------------------------------------------------------
+
+def sma(prices, window: int, dtype=np.float64):
+    """Column-wise Simple Moving Average."""
+    values, labels = _unwrap(prices)
+    return _wrap(kernels.sma(values, window), labels, dtype)
+
+
+def _ema(values: np.ndarray, window: int) -> np.ndarray:
+    out = kernels.ema(values, window)
+    # No stale carry-forward for delisted names or gaps
+    out[np.isnan(values)] = np.nan
+    return out
+
+
+def ema(prices, window: int, dtype=np.float64):
+    """Column-wise Exponential Moving Average (span, adjust=False)."""
+    values, labels = _unwrap(prices)
+    return _wrap(_ema(values, window), labels, dtype)
+
+
+# ---------------------------------------------------------
+# RSI / MACD / BOLLINGER / ROC
+# ---------------------------------------------------------
+
+def rsi(prices, window: int = 14, dtype=np.float64):
+    """Column-wise Relative Strength Index (same smoothing as rsi())."""
+    values, labels = _unwrap(prices)
+    return _wrap(kernels.rsi(values, window), labels, dtype)
+
+
+def macd(prices, fast=12, slow=26, signal=9, dtype=np.float64):
+    """Column-wise MACD. Returns macd_line, signal_line, histogram."""
+    values, labels = _unwrap(prices)
+    macd_line = _ema(values, fast) - _ema(values, slow)
+    signal_line = _ema(macd_line, signal)
+    return (
+        _wrap(macd_line, labels, dtype),
+        _wrap(signal_line, labels, dtype),
+        _wrap(macd_line - signal_line, labels, dtype),
+    )
+
+
+def bollinger_bands(prices, window=20, num_std=2, dtype=np.float64):
+    """Column-wise Bollinger Bands. Returns middle, upper, lower."""
+    values, labels = _unwrap(prices)
+    bands = kernels.bollinger_bands(values, window, num_std)
+    return tuple(_wrap(band, labels, dtype) for band in bands)
+
+
+def roc(prices, window=10, dtype=np.float64):
+    """Column-wise Rate of Change."""
+    values, labels = _unwrap(prices)
+    return _wrap(kernels.roc(values, window), labels, dtype)
+
+
+# ---------------------------------------------------------
+# ATR / STOCHASTIC (High, Low, Close panels)
+# ---------------------------------------------------------
+
+def atr(high, low, close, window=14, dtype=np.float64):
+    """Column-wise Average True Range."""
+    h, labels = _unwrap(high)
+    lo, _ = _unwrap(low)
+    c, _ = _unwrap(close)
+    return _wrap(kernels.atr(h, lo, c, window), labels, dtype)
+
+
+def stochastic(high, low, close, k_window=14, d_window=3, dtype=np.float64):
+    """Column-wise stochastic oscillator. Returns %K, %D."""
+    h, labels = _unwrap(high)
+    lo, _ = _unwrap(low)
+    c, _ = _unwrap(close)
+    percent_k, percent_d = kernels.stochastic(h, lo, c, k_window, d_window)
+    return _wrap(percent_k, labels, dtype), _wrap(percent_d, labels, dtype)
+
+
+# ---------------------------------------------------------
+# RULE SIGNALS
+# ---------------------------------------------------------
+
+def sma_crossover_signals(prices, window_fast=20, window_slow=50, allow_short=False):
+    """SMAStrategy rules across a panel: +1 when fast SMA > slow SMA, else 0 (or -1)."""
+    values, labels = _unwrap(prices)
+    fast = kernels.sma(values, window_fast)
+    slow = kernels.sma(values, window_slow)
+
+    signal = (fast > slow).astype(np.float64)
+    if allow_short:
+        signal = signal * 2 - 1
+    signal[np.isnan(fast) | np.isnan(slow)] = np.nan
+    return _wrap(signal, labels, np.float64)
+
+
+def rsi_signals(prices, window=14, overbought=70, oversold=30, allow_short=False):
+    """RSIStrategy rules across a panel."""
+    values, labels = _unwrap(prices)
+    r = rsi(values, window)
+
+    signal = np.where(r < oversold, 1.0, 0.0)
+    if allow_short:
+        signal[r > overbought] = -1.0
+    signal[np.isnan(r)] = np.nan
+    return _wrap(signal, labels, np.float64)
+
+
+def macd_signals(prices, fast=12, slow=26, signal=9, allow_short=False):
+    """MACDStrategy rules across a panel."""
+    values, labels = _unwrap(prices)
+    macd_line, signal_line, _ = macd(values, fast, slow, signal)
+
+    out = np.where(macd_line > signal_line, 1.0, 0.0)
+    if allow_short:
+        out[macd_line < signal_line] = -1.0
+    out[np.isnan(macd_line) | np.isnan(signal_line)] = np.nan
+    return _wrap(out, labels, np.float64)
@@ -7,6 +7,63 @@ sns.set_style("whitegrid")
 sns.set_context("talk")
 
 
+# ---------------------------------------------------------
+# VISUAL DOWNSAMPLING
+# ---------------------------------------------------------
+def lttb_indices(values, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the positions of at most n_out points that preserve the visual
+    shape of the series (peaks and troughs): the first and last points are
+    kept, and from each bucket in between the point forming the largest
+    triangle with the previously kept point and the next bucket's average.
+    NaN points are never selected.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    if n_out >= len(valid) or n_out < 3:
+        return valid
+
+    x = valid.astype(np.float64)
+    y = y[valid]
+    edges = np.linspace(1, len(y) - 1, n_out - 1).astype(np.int64)
+
+    # Averages of every bucket (the last "next bucket" is the final point)
+    csx = np.concatenate(([0.0], np.cumsum(x)))
+    csy = np.concatenate(([0.0], np.cumsum(y)))
+    counts = np.diff(edges)
+    avg_x = np.append((csx[edges[1:]] - csx[edges[:-1]]) / counts, x[-1])
+    avg_y = np.append((csy[edges[1:]] - csy[edges[:-1]]) / counts, y[-1])
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    a = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        # Twice the triangle area (constant factor dropped)
+        area = np.abs(
+            (x[a] - avg_x[k + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[k + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[k + 1] = a
+    out[-1] = len(y) - 1
+    return valid[out]
+
+
+def downsample(series: pd.Series, max_points, keep=()) -> pd.Series:
+    """
+    LTTB-downsample a series to about max_points for drawing; positions in
+    `keep` (e.g. the max drawdown trough) are always retained.
+    """
+    if max_points is None or len(series) <= max_points:
+        return series
+    idx = lttb_indices(series.to_numpy(dtype=np.float64), max_points)
+    idx = np.union1d(idx, np.asarray(keep, dtype=np.int64))
+    return series.iloc[idx]
+
+
 class Plotter:
     """
     A plotting utility that generates hedge-fund quality performance charts.
@@ -18,7 +75,14 @@ class Plotter:
     - Rolling Sharpe Ratio
     """
 
-    def __init__(self, results: pd.DataFrame):
+    def __init__(self, results: pd.DataFrame, max_points=4000):
+        """
+        Parameters:
+            results (pd.DataFrame): Backtest results with Equity and Net_Returns.
+            max_points (int): Line charts are LTTB-downsampled to about this
+                many points before drawing, so render time does not grow
+                with history length; None draws every point.
+        """
         if not isinstance(results, pd.DataFrame):
             raise TypeError("Plotter expects a pandas DataFrame.")
 
@@ -28,13 +92,31 @@ class Plotter:
                 raise ValueError(f"Missing required column in results DataFrame: {col}")
 
         self.results = results
+        self.max_points = max_points
+
+    def _trough(self, drawdown: pd.Series) -> list:
+        """Positions of the max drawdown trough and the peak before it."""
+        values = drawdown.to_numpy(dtype=np.float64)
+        if np.isnan(values).all():
+            return []
+        trough = int(np.nanargmin(values))
+        peaks = np.flatnonzero(values[: trough + 1] == 0)
+        return [trough] + ([int(peaks[-1])] if len(peaks) else [])
+
+    def _drawdown(self) -> pd.Series:
+        rolling_max = self.results["Equity"].cummax()
+        return (self.results["Equity"] - rolling_max) / rolling_max
 
     # ---------------------------------------------------------
     # EQUITY CURVE
     # ---------------------------------------------------------
     def plot_equity_curve(self, save_path=None):
+        equity = downsample(
+            self.results["Equity"], self.max_points, keep=self._trough(self._drawdown())
+        )
+
         plt.figure(figsize=(12, 6))
-        plt.plot(self.results["Equity"], label="Equity Curve", color="#0066CC", linewidth=2)
+        plt.plot(equity, label="Equity Curve", color="#0066CC", linewidth=2)
         plt.title("Equity Curve", fontsize=18)
         plt.xlabel("Time")
         plt.ylabel("Portfolio Value")
@@ -49,8 +131,8 @@ class Plotter:
     # DRAWDOWN CURVE
     # ---------------------------------------------------------
     def plot_drawdown(self, save_path=None):
-        rolling_max = self.results["Equity"].cummax()
-        drawdown = (self.results["Equity"] - rolling_max) / rolling_max
+        drawdown = self._drawdown()
+        drawdown = downsample(drawdown, self.max_points, keep=self._trough(drawdown))
 
         plt.figure(figsize=(12, 5))
         plt.plot(drawdown, color="#CC0000", linewidth=1.8)
@@ -86,6 +168,7 @@ class Plotter:
         rolling_sharpe = (
             returns.rolling(window).mean() / returns.rolling(window).std()
         ) * np.sqrt(252)
+        rolling_sharpe = downsample(rolling_sharpe, self.max_points)
 
         plt.figure(figsize=(12, 5))
         plt.plot(rolling_sharpe, color="#8A2BE2", linewidth=2)
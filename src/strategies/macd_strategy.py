@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from ..feature_view import as_view, signals_to_series
+from ..panel_indicators import macd_signals
+
+
+class MACDStrategy:
+    """
+    MACD (Moving Average Convergence Divergence) Strategy.
+
+    Signal Logic:
+        - MACD line crosses ABOVE signal line → Buy (+1)
+        - MACD line crosses BELOW signal line → Sell (-1 or 0)
+    """
+
+    def __init__(
+        self,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        allow_short: bool = False
+    ):
+        """
+        Parameters:
+            fast (int): Fast EMA period.
+            slow (int): Slow EMA period.
+            signal (int): Signal line EMA period.
+            allow_short (bool): Enable short signals.
+        """
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self.allow_short = allow_short
+
+    def declare_features(self, graph) -> dict:
+        """Declare the MACD lines this strategy needs on a FeatureGraph."""
+        macd_line, signal_line, histogram = graph.macd(
+            "Close", fast=self.fast, slow=self.slow, signal=self.signal
+        )
+        return {"MACD": macd_line, "Signal": signal_line, "Hist": histogram}
+
+    def generate_panel_signals(self, close):
+        """
+        MACD crossover signals for a whole universe at once.
+
+        Parameters:
+            close (pd.DataFrame): Close prices, one column per asset.
+
+        Returns:
+            pd.DataFrame: Signals per asset; NaN wherever the asset has no
+            price (late listing, delisting).
+        """
+        return macd_signals(
+            close, self.fast, self.slow, self.signal, allow_short=self.allow_short
+        )
+
+    def compute_signals(self, view) -> np.ndarray:
+        """
+        MACD crossover signals from a read-only FeatureView.
+
+        Returns:
+            np.ndarray: +1, 0 or -1 per row; NaN on rows with missing data.
+        """
+        macd_line, signal_line, _ = view.macd(
+            "Close",
+            fast=self.fast,
+            slow=self.slow,
+            signal=self.signal
+        )
+
+        signal = np.zeros(len(macd_line))
+
+        # Crossover signals
+        crossover_up = macd_line > signal_line
+        crossover_down = macd_line < signal_line
+
+        # Long on bullish crossover
+        signal[crossover_up] = +1
+
+        if self.allow_short:
+            signal[crossover_down] = -1
+        else:
+            signal[crossover_down] = 0
+
+        signal[np.isnan(macd_line) | np.isnan(signal_line) | ~view.complete_rows()] = np.nan
+        return signal
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Generate trading signals using MACD crossovers.
+
+        Returns:
+            pd.Series: Vector of +1, 0, or -1.
+        """
+        view = as_view(df)
+        return signals_to_series(self.compute_signals(view), view)
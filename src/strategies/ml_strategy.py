@@ -0,0 +1,173 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from ..feature_view import as_view, signals_to_series
+
+
+class MLStrategy:
+    """
+    ML-based trading strategy.
+
+    Supports:
+        - Regression models (predict returns → convert to signals)
+        - Classification models (predict +1 / 0 / -1 directly)
+        - Probability thresholds for long/short entry
+
+    Inference runs over row batches of the feature matrix, so memory stays
+    bounded by batch_size however long the history is; with n_jobs > 1 the
+    batches are scored on a thread pool (most model libraries release the
+    GIL inside predict).
+    """
+
+    def __init__(
+        self,
+        model,
+        feature_cols,
+        prediction_type: str = "regression",
+        long_threshold: float = 0.001,
+        short_threshold: float = -0.001,
+        allow_short: bool = True,
+        prob_threshold: float = 0.55,
+        batch_size: int = 100_000,
+        n_jobs: int = 1,
+        prediction_cache=None,
+    ):
+        """
+        Parameters:
+            model: Pretrained ML model (sklearn, XGBoost, keras, PyTorch wrapper, etc.)
+            feature_cols (list): Columns used as model inputs.
+            prediction_type (str): "regression" or "classification".
+            long_threshold (float): Min predicted return to go long.
+            short_threshold (float): Max predicted return to go short.
+            allow_short (bool): Enable short selling.
+            prob_threshold (float): For classification probability cutoff.
+            batch_size (int): Feature rows per model call (None = all at once).
+            n_jobs (int): Threads scoring batches concurrently.
+            prediction_cache (PredictionCache): Optional on-disk cache of raw
+                model outputs per batch; threshold changes then skip the model.
+        """
+        if prediction_type not in ("regression", "classification"):
+            raise ValueError("prediction_type must be 'regression' or 'classification'")
+
+        self.model = model
+        self.feature_cols = feature_cols
+        self.prediction_type = prediction_type
+        self.long_threshold = long_threshold
+        self.short_threshold = short_threshold
+        self.allow_short = allow_short
+        self.prob_threshold = prob_threshold
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.prediction_cache = prediction_cache
+
+    # ---------------------------------------------------------
+    # Model Scoring
+    # ---------------------------------------------------------
+    def _uses_proba(self) -> bool:
+        return self.prediction_type == "classification" and hasattr(self.model, "predict_proba")
+
+    def _score(self, X: np.ndarray) -> np.ndarray:
+        """
+        Raw model output for a batch of rows: predicted returns (regression),
+        P(class 1) (classifiers with predict_proba) or predicted classes.
+        """
+        if self._uses_proba():
+            # We assume class 1 = long, class 0 = short, modify as needed
+            return np.asarray(self.model.predict_proba(X))[:, 1]
+        return np.asarray(self.model.predict(X), dtype=np.float64)
+
+    def _score_cached(self, X: np.ndarray, model_fp) -> np.ndarray:
+        """_score() through the prediction cache, when one is configured."""
+        if self.prediction_cache is None or model_fp is None:
+            return self._score(X)
+
+        key = self.prediction_cache.chunk_key(
+            model_fp, "proba" if self._uses_proba() else "predict", X
+        )
+        raw = self.prediction_cache.get_predictions(key)
+        if raw is None:
+            raw = self._score(X)
+            self.prediction_cache.put_predictions(key, raw)
+        return raw
+
+    def _batches(self, n_rows: int) -> list:
+        step = self.batch_size or n_rows or 1
+        return [slice(start, min(start + step, n_rows)) for start in range(0, n_rows, step)]
+
+    # ---------------------------------------------------------
+    # Signal Rules
+    # ---------------------------------------------------------
+    def _apply_thresholds(self, raw: np.ndarray) -> np.ndarray:
+        """Map raw model output to +1, 0, or -1 (vectorized)."""
+        signals = np.zeros(len(raw))
+
+        # ---------------------------------------------------------
+        # 1) Regression Models (e.g., predict future % return)
+        # ---------------------------------------------------------
+        if self.prediction_type == "regression":
+            signals[raw > self.long_threshold] = +1
+
+            if self.allow_short:
+                signals[raw < self.short_threshold] = -1
+            else:
+                signals[raw < self.short_threshold] = 0
+
+        # ---------------------------------------------------------
+        # 2) Classification Models
+        # ---------------------------------------------------------
+        elif hasattr(self.model, "predict_proba"):
+            signals[raw > self.prob_threshold] = +1
+
+            if self.allow_short:
+                signals[raw < (1 - self.prob_threshold)] = -1
+
+        # If no probabilities, assume raw class predictions
+        else:
+            # Expect +1, 0, -1 format; if not, convert automatically
+            signals = np.sign(np.nan_to_num(raw))
+
+            if not self.allow_short:
+                signals[signals == -1] = 0
+
+        return signals
+
+    # ---------------------------------------------------------
+    # Generate ML-Based Signals
+    # ---------------------------------------------------------
+    def compute_signals(self, view) -> np.ndarray:
+        """
+        Uses ML model predictions on a read-only FeatureView to generate
+        +1, 0, or -1 per row. Only one feature batch per worker thread is
+        materialized at a time.
+        """
+        # Ensure features exist
+        view.columns(self.feature_cols, rows=slice(0, 0))
+
+        signals = np.empty(len(view))
+        model_fp = None
+        if self.prediction_cache is not None:
+            model_fp = self.prediction_cache.model_fingerprint(self.model)
+
+        def score_batch(rows):
+            X = view.columns(self.feature_cols, rows=rows)
+            signals[rows] = self._apply_thresholds(self._score_cached(X, model_fp))
+
+        batches = self._batches(len(view))
+        if self.n_jobs > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+                list(pool.map(score_batch, batches))
+        else:
+            for rows in batches:
+                score_batch(rows)
+
+        if self.prediction_cache is not None:
+            self.prediction_cache.evict()
+        return signals
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Uses ML model predictions to generate +1, 0, or -1 signals.
+        """
+        view = as_view(df)
+        return signals_to_series(self.compute_signals(view), view)
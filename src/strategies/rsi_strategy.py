@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+from ..feature_view import as_view, signals_to_series
+from ..panel_indicators import rsi_signals
+
+
+class RSIStrategy:
+    """
+    RSI Overbought/Oversold Mean-Reversion or Trend Strategy.
+
+    Signal Logic:
+        - If RSI < oversold → Buy (+1)
+        - If RSI > overbought → Sell (-1 or 0 depending on `allow_short`)
+        - Otherwise → Hold (previous position)
+    """
+
+    def __init__(
+        self,
+        window: int = 14,
+        overbought: float = 70,
+        oversold: float = 30,
+        allow_short: bool = False,
+    ):
+        """
+        Parameters:
+            window (int): RSI window length.
+            overbought (float): Overbought threshold.
+            oversold (float): Oversold threshold.
+            allow_short (bool): Enable short selling if True.
+        """
+        self.window = window
+        self.overbought = overbought
+        self.oversold = oversold
+        self.allow_short = allow_short
+
+    def declare_features(self, graph) -> dict:
+        """Declare the RSI this strategy needs on a FeatureGraph."""
+        return {"RSI": graph.rsi("Close", self.window)}
+
+    def generate_panel_signals(self, close):
+        """
+        RSI threshold signals for a whole universe at once.
+
+        Parameters:
+            close (pd.DataFrame): Close prices, one column per asset.
+
+        Returns:
+            pd.DataFrame: Signals per asset; NaN during warm-up and wherever
+            the asset has no price (late listing, delisting).
+        """
+        return rsi_signals(
+            close,
+            window=self.window,
+            overbought=self.overbought,
+            oversold=self.oversold,
+            allow_short=self.allow_short,
+        )
+
+    def compute_signals(self, view) -> np.ndarray:
+        """
+        RSI threshold signals from a read-only FeatureView.
+
+        Returns:
+            np.ndarray: +1, 0 or -1 per row; NaN on warm-up rows and rows
+            with missing data.
+        """
+        rsi = view.rsi("Close", self.window)
+
+        signal = np.zeros(len(rsi))
+
+        # Oversold → Buy
+        signal[rsi < self.oversold] = +1
+
+        if self.allow_short:
+            # Overbought → Short
+            signal[rsi > self.overbought] = -1
+        else:
+            # Overbought → Go flat
+            signal[rsi > self.overbought] = 0
+
+        signal[np.isnan(rsi) | ~view.complete_rows()] = np.nan
+        return signal
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Generate trading signals using RSI threshold rules.
+
+        Returns:
+            pd.Series: Signals vector (+1, 0, or -1)
+        """
+        view = as_view(df)
+        return signals_to_series(self.compute_signals(view), view)
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+from ..feature_view import as_view, signals_to_series
+from ..indicators import sma_multi
+from ..panel_indicators import sma_crossover_signals
+
+
+class SMAStrategy:
+    """
+    Simple Moving Average Crossover Strategy.
+
+    Generates signals:
+        +1 → Long
+         0 → Flat
+        -1 → Short (optional)
+    
+    Works with:
+    - backtester.py
+    - indicators.py
+    """
+
+    def __init__(self, window_fast=20, window_slow=50, allow_short=False):
+        """
+        Parameters:
+            window_fast (int): Fast SMA window length.
+            window_slow (int): Slow SMA window length.
+            allow_short (bool): Enable short selling if True.
+        """
+        self.window_fast = window_fast
+        self.window_slow = window_slow
+        self.allow_short = allow_short
+
+    def declare_features(self, graph) -> dict:
+        """Declare the SMAs this strategy needs on a FeatureGraph."""
+        return {
+            "SMA_Fast": graph.sma("Close", self.window_fast),
+            "SMA_Slow": graph.sma("Close", self.window_slow),
+        }
+
+    @staticmethod
+    def grid_pairs(fast_windows, slow_windows) -> list:
+        """All valid (fast, slow) pairs, i.e. fast < slow, in grid order."""
+        return [(f, s) for f in fast_windows for s in slow_windows if f < s]
+
+    @classmethod
+    def grid_signals(cls, data, fast_windows, slow_windows, allow_short=False):
+        """
+        Crossover signals for every valid (fast, slow) pair at once.
+
+        Each distinct window's SMA is computed once from a single shared
+        cumulative sum (sma_multi), and each fast SMA is compared against
+        all slow SMAs in one broadcast, so a 200 x 200 grid costs a few
+        hundred rolling means rather than one strategy run per pair.
+
+        Parameters:
+            data (pd.DataFrame | pd.Series | np.ndarray): Frame with 'Close',
+                or the close prices themselves.
+            fast_windows (list): Candidate fast SMA windows.
+            slow_windows (list): Candidate slow SMA windows.
+            allow_short (bool): Emit -1 instead of 0 when fast < slow.
+
+        Returns:
+            tuple: (signals, pairs) where signals is an int8 (bars x pairs)
+            array, ready for Backtester.run_batch(), and pairs lists the
+            (fast, slow) pair of each column. Warm-up rows (slow SMA not
+            yet defined) are 0, as in run_compact().
+        """
+        if isinstance(data, pd.DataFrame):
+            data = data["Close"]
+        close = np.asarray(data, dtype=np.float64)
+
+        # Crossovers are shift-invariant, so centring only buys precision
+        finite = close[np.isfinite(close)]
+        close = close - (finite[0] if len(finite) else 0.0)
+
+        windows = sorted(set(fast_windows) | set(slow_windows))
+        column = {w: j for j, w in enumerate(windows)}
+        smas = sma_multi(close, windows)
+
+        pairs = cls.grid_pairs(fast_windows, slow_windows)
+        signals = np.zeros((len(close), len(pairs)), dtype=np.int8)
+        k = 0
+        for f in fast_windows:
+            slows = [column[s] for s in slow_windows if f < s]
+            if not slows:
+                continue
+            block = signals[:, k:k + len(slows)]
+            fast = smas[:, column[f], None]
+            slow = smas[:, slows]
+            np.greater(fast, slow, out=block, casting="unsafe")
+            if allow_short:
+                block *= 2
+                block -= 1
+                # NaN comparisons are False: keep warm-up rows flat
+                block[np.isnan(slow) | np.isnan(fast)] = 0
+            k += len(slows)
+        return signals, pairs
+
+    def generate_panel_signals(self, close):
+        """
+        Crossover signals for a whole universe at once.
+
+        Parameters:
+            close (pd.DataFrame): Close prices, one column per asset.
+
+        Returns:
+            pd.DataFrame: Signals per asset; NaN during warm-up and wherever
+            the asset has no price (late listing, delisting).
+        """
+        return sma_crossover_signals(
+            close, self.window_fast, self.window_slow, allow_short=self.allow_short
+        )
+
+    def compute_signals(self, view) -> np.ndarray:
+        """
+        SMA crossover signals from a read-only FeatureView.
+
+        Returns:
+            np.ndarray: +1, 0, -1 per row (depending on settings); NaN on
+            warm-up rows and rows with missing data.
+        """
+        fast = view.sma("Close", self.window_fast)
+        slow = view.sma("Close", self.window_slow)
+
+        # Long when fast SMA > slow SMA
+        signal = (fast > slow).astype(np.float64)
+
+        if self.allow_short:
+            # Short when fast < slow
+            signal = signal * 2 - 1   # +1 or -1
+
+        signal[np.isnan(fast) | np.isnan(slow) | ~view.complete_rows()] = np.nan
+        return signal
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Generate signal vector using SMA crossover logic.
+
+        Returns:
+            pd.Series: Signals (+1, 0, -1 depending on settings)
+        """
+        view = as_view(df)
+        return signals_to_series(self.compute_signals(view), view)
@@ -0,0 +1,343 @@
+import copy
+import math
+from collections import deque
+
+
+class StreamingIndicator:
+    """
+    Base class for online indicators.
+
+    Each subclass consumes one observation per update() call in O(1)
+    amortized time and produces the same values as its batch counterpart
+    in indicators.py over the same input (NaN while warming up).
+    """
+
+    def update(self, *args):
+        raise NotImplementedError
+
+    def snapshot(self) -> dict:
+        """Return a copy of the internal state (e.g. to checkpoint a live feed)."""
+        return copy.deepcopy(self.__dict__)
+
+    def restore(self, state: dict):
+        """Restore state produced by snapshot()."""
+        self.__dict__.update(copy.deepcopy(state))
+        return self
+
+
+# ---------------------------------------------------------
+# MOVING AVERAGES
+# ---------------------------------------------------------
+
+class StreamingSMA(StreamingIndicator):
+    """
+    Simple Moving Average over a ring buffer (matches sma()).
+
+    The running sum is re-derived from the buffer once per `window`
+    updates, so rounding drift cannot build up on long-lived streams.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = deque(maxlen=window)
+        self.total = 0.0
+        self.n_nan = 0
+        self.n_updates = 0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        if len(self.buffer) == self.window:
+            old = self.buffer[0]
+            if math.isnan(old):
+                self.n_nan -= 1
+            else:
+                self.total -= old
+        self.buffer.append(x)
+        if math.isnan(x):
+            self.n_nan += 1
+        else:
+            self.total += x
+
+        self.n_updates += 1
+        if self.n_updates % self.window == 0:
+            self.total = math.fsum(v for v in self.buffer if not math.isnan(v))
+
+        if len(self.buffer) < self.window or self.n_nan:
+            self.value = math.nan
+        else:
+            self.value = self.total / self.window
+        return self.value
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Exponential Moving Average, span-based with adjust=False (matches ema()).
+
+    As in the batch kernel (ignore_na=False), the weight of the running
+    average keeps decaying across NaN inputs, so the first value after a
+    gap is weighted by how long the gap was.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.alpha = 2 / (window + 1)
+        self.old_wt = 1.0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        if not math.isnan(self.value):
+            self.old_wt *= 1.0 - self.alpha
+            if not math.isnan(x):
+                if self.value != x:
+                    self.value = (self.old_wt * self.value + self.alpha * x) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif not math.isnan(x):
+            self.value = x
+        return self.value
+
+
+# ---------------------------------------------------------
+# RSI
+# ---------------------------------------------------------
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Relative Strength Index.
+
+    Uses rolling means of gains and losses over `window` bars, the same
+    smoothing as rsi(), so live values line up with the backtest. A NaN
+    price enters both means as a NaN delta, so the RSI stays NaN until it
+    has left the window, as in the batch version.
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.avg_gain = StreamingSMA(window)
+        self.avg_loss = StreamingSMA(window)
+        self.prev = math.nan
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        delta = x - self.prev
+        self.prev = x
+        if math.isnan(delta):
+            gain = self.avg_gain.update(math.nan)
+            loss = self.avg_loss.update(math.nan)
+        else:
+            gain = self.avg_gain.update(max(delta, 0.0))
+            loss = self.avg_loss.update(max(-delta, 0.0))
+
+        if math.isnan(gain) or math.isnan(loss):
+            self.value = math.nan
+        elif loss == 0:
+            self.value = 100.0 if gain > 0 else math.nan
+        else:
+            self.value = 100 - 100 / (1 + gain / loss)
+        return self.value
+
+
+# ---------------------------------------------------------
+# MACD
+# ---------------------------------------------------------
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram (matches macd())."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.ema_fast = StreamingEMA(fast)
+        self.ema_slow = StreamingEMA(slow)
+        self.ema_signal = StreamingEMA(signal)
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, x: float):
+        macd_line = self.ema_fast.update(x) - self.ema_slow.update(x)
+        signal_line = self.ema_signal.update(macd_line)
+        self.value = (macd_line, signal_line, macd_line - signal_line)
+        return self.value
+
+
+# ---------------------------------------------------------
+# BOLLINGER BANDS
+# ---------------------------------------------------------
+
+class StreamingMeanStd(StreamingIndicator):
+    """
+    Rolling mean and sample standard deviation over `window` values with a
+    windowed Welford update (matches rolling_mean() / rolling_std()).
+    Returns mean, std.
+
+    A NaN in the window makes both NaN, as in the batch version; the
+    moments are rebuilt from the buffer once it has left, and re-derived
+    once per `window` updates so rounding drift cannot build up.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.n_nan = 0
+        self.n_updates = 0
+        self.value = (math.nan, math.nan)
+
+    def update(self, x: float):
+        full = len(self.buffer) == self.window
+        old = self.buffer[0] if full else math.nan
+        self.buffer.append(x)
+        if full and math.isnan(old):
+            self.n_nan -= 1
+        if math.isnan(x):
+            self.n_nan += 1
+
+        self.n_updates += 1
+        if self.n_nan:
+            # Moments are rebuilt once the NaN has left the window
+            pass
+        elif not full:
+            n = len(self.buffer)
+            delta = x - self.mean
+            self.mean += delta / n
+            self.m2 += delta * (x - self.mean)
+        elif math.isnan(old) or self.n_updates % self.window == 0:
+            self._rebuild()
+        else:
+            old_mean = self.mean
+            self.mean += (x - old) / self.window
+            self.m2 += (x - old) * (x - self.mean + old - old_mean)
+
+        if len(self.buffer) < self.window or self.n_nan or self.window < 2:
+            self.value = (math.nan, math.nan)
+        else:
+            self.value = (self.mean, math.sqrt(max(self.m2, 0.0) / (self.window - 1)))
+        return self.value
+
+    def _rebuild(self):
+        values = list(self.buffer)
+        self.mean = math.fsum(values) / len(values)
+        self.m2 = math.fsum((v - self.mean) ** 2 for v in values)
+
+
+class StreamingBollinger(StreamingIndicator):
+    """
+    Bollinger Bands from a StreamingMeanStd (sample std, matches
+    bollinger_bands()). Returns middle, upper, lower.
+    """
+
+    def __init__(self, window: int = 20, num_std: float = 2):
+        self.window = window
+        self.num_std = num_std
+        self.moments = StreamingMeanStd(window)
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, x: float):
+        mean, std = self.moments.update(x)
+        self.value = (mean, mean + self.num_std * std, mean - self.num_std * std)
+        return self.value
+
+
+# ---------------------------------------------------------
+# ATR - Average True Range
+# ---------------------------------------------------------
+
+def _fmax(*values) -> float:
+    """Largest non-NaN value (NaN if all are NaN), like np.fmax."""
+    finite = [v for v in values if not math.isnan(v)]
+    return max(finite) if finite else math.nan
+
+
+class StreamingATR(StreamingIndicator):
+    """Average True Range from High/Low/Close updates (matches atr())."""
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.sma = StreamingSMA(window)
+        self.prev_close = math.nan
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float) -> float:
+        true_range = _fmax(
+            high - low, abs(high - self.prev_close), abs(low - self.prev_close)
+        )
+        self.prev_close = close
+        self.value = self.sma.update(true_range)
+        return self.value
+
+
+# ---------------------------------------------------------
+# ROC - Rate of Change
+# ---------------------------------------------------------
+
+class StreamingROC(StreamingIndicator):
+    """Rate of Change over `window` bars (matches roc())."""
+
+    def __init__(self, window: int = 10):
+        self.window = window
+        self.buffer = deque(maxlen=window + 1)
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        self.buffer.append(x)
+        if len(self.buffer) <= self.window:
+            self.value = math.nan
+        else:
+            self.value = x / self.buffer[0] - 1
+        return self.value
+
+
+# ---------------------------------------------------------
+# STOCHASTIC OSCILLATOR
+# ---------------------------------------------------------
+
+class StreamingStochastic(StreamingIndicator):
+    """
+    %K / %D stochastic oscillator (matches stochastic()).
+
+    Rolling min/max use monotonic deques, so each update is O(1) amortized.
+    NaN lows/highs are kept out of the deques; while one is in the window
+    %K is NaN, as the batch rolling min/max are.
+    """
+
+    def __init__(self, k_window: int = 14, d_window: int = 3):
+        self.k_window = k_window
+        self.t = 0
+        self.lows = deque()    # (t, low), increasing lows
+        self.highs = deque()   # (t, high), decreasing highs
+        self.nan_ts = deque()  # t of bars with a NaN low or high
+        self.d_sma = StreamingSMA(d_window)
+        self.value = (math.nan, math.nan)
+
+    def update(self, high: float, low: float, close: float):
+        t = self.t
+        self.t += 1
+
+        if math.isnan(low) or math.isnan(high):
+            self.nan_ts.append(t)
+        if not math.isnan(low):
+            while self.lows and self.lows[-1][1] >= low:
+                self.lows.pop()
+            self.lows.append((t, low))
+        if not math.isnan(high):
+            while self.highs and self.highs[-1][1] <= high:
+                self.highs.pop()
+            self.highs.append((t, high))
+
+        expired = t - self.k_window
+        if self.lows and self.lows[0][0] <= expired:
+            self.lows.popleft()
+        if self.highs and self.highs[0][0] <= expired:
+            self.highs.popleft()
+        if self.nan_ts and self.nan_ts[0] <= expired:
+            self.nan_ts.popleft()
+
+        if self.t < self.k_window or self.nan_ts:
+            percent_k = math.nan
+        else:
+            low_min = self.lows[0][1]
+            span = self.highs[0][1] - low_min
+            if span != 0:
+                percent_k = 100 * (close - low_min) / span
+            else:
+                percent_k = math.nan if close == low_min else math.copysign(math.inf, close - low_min)
+
+        self.value = (percent_k, self.d_sma.update(percent_k))
+        return self.value
@@ -0,0 +1,138 @@
+import math
+
+from .streaming_indicators import StreamingIndicator, StreamingMeanStd
+
+
+class StreamingRiskTracker(StreamingIndicator):
+    """
+    Online risk statistics for live monitoring.
+
+    Consumes one net return (and optionally the equity value) per
+    update() in O(1) and keeps:
+        - running mean / variance (Welford) -> Volatility, Sharpe Ratio
+        - running downside variance over negative returns -> Sortino Ratio
+        - windowed mean / variance over the last `window` returns -> Rolling Sharpe
+        - running max equity -> current Drawdown and Max Drawdown
+
+    Values match the batch Metrics methods over the same history: NaN
+    returns are skipped by the running statistics, and a NaN inside the
+    rolling window makes Rolling Sharpe NaN, as pandas rolling does.
+    """
+
+    def __init__(self, window: int = 30, trading_days: int = 252, initial_equity: float = 1.0):
+        """
+        Parameters:
+            window (int): Rolling Sharpe window (as Metrics.rolling_sharpe).
+            trading_days (int): Annualization factor.
+            initial_equity (float): Starting equity when update() is not
+                given an equity value (returns are compounded from it).
+        """
+        self.window = window
+        self.trading_days = trading_days
+
+        # Running moments of all / negative returns
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.neg_count = 0
+        self.neg_mean = 0.0
+        self.neg_m2 = 0.0
+
+        # Windowed moments
+        self.rolling = StreamingMeanStd(window)
+
+        # Drawdown
+        self.equity = initial_equity
+        self.peak = math.nan
+        self.drawdown = math.nan
+        self.max_drawdown = math.nan
+
+    # ---------------------------------------------------------
+    # Per-Return Update
+    # ---------------------------------------------------------
+    def update(self, ret: float, equity: float = None) -> dict:
+        """
+        Consume one bar.
+
+        Parameters:
+            ret (float): Net return of the bar (NaN is skipped).
+            equity (float): Equity after the bar; compounded from the
+                returns when omitted.
+
+        Returns:
+            dict: Current values (see value()).
+        """
+        if not math.isnan(ret):
+            self._update_running(ret)
+        self.rolling.update(ret)
+
+        if equity is None:
+            if not math.isnan(ret):
+                self.equity *= 1 + ret
+            equity = self.equity
+        else:
+            self.equity = equity
+        self._update_drawdown(equity)
+        return self.value()
+
+    def _update_running(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+        if x < 0:
+            self.neg_count += 1
+            delta = x - self.neg_mean
+            self.neg_mean += delta / self.neg_count
+            self.neg_m2 += delta * (x - self.neg_mean)
+
+    def _update_drawdown(self, equity):
+        if math.isnan(equity):
+            return
+        self.peak = equity if math.isnan(self.peak) else max(self.peak, equity)
+        self.drawdown = (equity - self.peak) / self.peak
+        if math.isnan(self.max_drawdown) or self.drawdown < self.max_drawdown:
+            self.max_drawdown = self.drawdown
+
+    # ---------------------------------------------------------
+    # Current Values
+    # ---------------------------------------------------------
+    @property
+    def volatility(self) -> float:
+        """Annualized volatility (population std, as Metrics.volatility)."""
+        if self.count == 0:
+            return math.nan
+        return math.sqrt(max(self.m2, 0.0) / self.count) * math.sqrt(self.trading_days)
+
+    @property
+    def sharpe(self) -> float:
+        vol = self.volatility
+        return math.sqrt(self.trading_days) * self.mean / vol if vol > 0 else 0.0
+
+    @property
+    def sortino(self) -> float:
+        if self.neg_count == 0:
+            return 0.0
+        downside = math.sqrt(max(self.neg_m2, 0.0) / self.neg_count)
+        return math.sqrt(self.trading_days) * self.mean / downside if downside > 0 else 0.0
+
+    @property
+    def rolling_sharpe(self) -> float:
+        """Sharpe over the last `window` returns (as Metrics.rolling_sharpe)."""
+        mean, std = self.rolling.value
+        if math.isnan(std):
+            return math.nan
+        if std == 0:
+            return math.nan if mean == 0 else math.copysign(math.inf, mean)
+        return mean / std * math.sqrt(self.trading_days)
+
+    def value(self) -> dict:
+        return {
+            "Volatility": self.volatility,
+            "Sharpe Ratio": self.sharpe,
+            "Sortino Ratio": self.sortino,
+            "Rolling Sharpe": self.rolling_sharpe,
+            "Drawdown": self.drawdown,
+            "Max Drawdown": self.max_drawdown,
+        }
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ten bars with rises, falls and a trend reversal
+PRICES = [10, 11, 12, 11, 10, 9, 10, 11, 12, 13]
+
+
+# ---------------------------------------------------------
+# Strategies
+# ---------------------------------------------------------
+
+class MomentumStrategy:
+    """
+    Long when the close rose over the last `window` bars (NaN while warming
+    up); counts its calls.
+    """
+
+    def __init__(self, window=2):
+        self.window = window
+
+    def generate_signals(self, df):
+        self.calls = getattr(self, "calls", 0) + 1
+        change = df["Close"].diff(self.window)
+        return change.gt(0).astype(float).where(change.notna())
+
+
+class FixedSignalStrategy:
+    """Replays a precomputed signal vector."""
+
+    def __init__(self, signals):
+        self.signals = signals
+
+    def generate_signals(self, df):
+        return pd.Series(self.signals, index=df.index)
+
+
+# ---------------------------------------------------------
+# Price Data
+# ---------------------------------------------------------
+
+def write_prices(file, close=PRICES):
+    """Write a Close-only price CSV and return its path."""
+    pd.DataFrame({"Close": close}).to_csv(file, index=False)
+    return file
+
+
+def mock_ohlc(n=200, seed=0):
+    """Random-walk High/Low/Close bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    spread = np.abs(rng.normal(0, 0.5, n))
+    return pd.DataFrame({"High": close + spread, "Low": close - spread, "Close": close})
+
+
+@pytest.fixture
+def prices_file(tmp_path):
+    """PRICES written to a CSV in the test's temporary directory."""
+    return write_prices(tmp_path / "prices.csv")
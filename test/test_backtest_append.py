@@ -0,0 +1,35 @@
+import pandas as pd
+from conftest import MomentumStrategy
+from src.backtest.backtest import Backtester
+
+
+def test_append_matches_full_rerun(tmp_path, prices_file):
+    expected = Backtester(prices_file, MomentumStrategy(2), commission=0.001).run()
+
+    head = tmp_path / "head.csv"
+    pd.read_csv(prices_file).iloc[:7].to_csv(head, index=False)
+    bt = Backtester(head, MomentumStrategy(2), commission=0.001)
+    bt.run()
+    new = bt.append(pd.read_csv(prices_file).iloc[7:], lookback=3)
+
+    cols = ["Signal", "Net_Returns", "Equity"]
+    pd.testing.assert_frame_equal(bt.results[cols], expected[cols])
+    pd.testing.assert_frame_equal(new[cols], expected[cols].iloc[6:])
+    assert bt.data is bt.results
+
+
+def test_repeated_appends_continue_state(tmp_path, prices_file):
+    expected = Backtester(prices_file, MomentumStrategy(2), commission=0.001).run(compact=True)
+
+    head = tmp_path / "head.csv"
+    bars = pd.read_csv(prices_file)
+    bars.iloc[:4].to_csv(head, index=False)
+    bt = Backtester(head, MomentumStrategy(2), commission=0.001)
+    bt.run(compact=True)
+    for i in range(4, len(bars)):
+        bt.append(bars.iloc[i:i + 1], lookback=3)
+    assert len(bt._appended) == len(bars) - 4
+
+    cols = ["Signal", "Net_Returns", "Equity"]
+    pd.testing.assert_frame_equal(bt.results[cols], expected[cols], check_exact=False)
+    assert not bt._appended
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from conftest import FixedSignalStrategy
+from src.backtest.backtest import Backtester
+
+
+def test_run_batch_matches_run(prices_file):
+    grid = np.array([
+        [np.nan, 0, 1, 1, 0, -1, -1, 1, 1],
+        [1, 1, 1, 1, 1, 1, 1, 1, 1],
+    ]).T
+
+    batch = Backtester(prices_file, strategy=None, commission=0.001).run_batch(grid)
+
+    for j in range(grid.shape[1]):
+        bt = Backtester(prices_file, FixedSignalStrategy(grid[:, j]), commission=0.001)
+        results = bt.run()
+        np.testing.assert_allclose(batch["Equity"][:, j], results["Equity"])
+        np.testing.assert_allclose(batch["Net_Returns"][:, j], results["Net_Returns"])
+
+
+def test_run_batch_rejects_misaligned_signals(prices_file):
+    bt = Backtester(prices_file, strategy=None)
+    with pytest.raises(ValueError):
+        bt.run_batch(np.zeros((3, 2)))
@@ -0,0 +1,18 @@
+import pandas as pd
+from conftest import MomentumStrategy
+from src.backtest.backtest import Backtester
+
+
+def test_chunked_run_matches_full_run(tmp_path, prices_file):
+    bt = Backtester(prices_file, MomentumStrategy(3), commission=0.001)
+    expected = bt.run()
+
+    chunked = Backtester(prices_file, MomentumStrategy(3), commission=0.001)
+    results = pd.concat(chunked.iter_chunks(chunksize=4, lookback=3))
+
+    cols = ["Signal", "Net_Returns", "Equity"]
+    pd.testing.assert_frame_equal(results[cols], expected[cols])
+
+    summary = chunked.run_chunked(tmp_path / "out.csv", chunksize=4, lookback=3)
+    assert summary["rows"] == len(expected)
+    assert summary["final_equity"] == expected["Equity"].iloc[-1]
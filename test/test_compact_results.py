@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+from conftest import MomentumStrategy
+from src.backtest.backtest import Backtester
+
+
+def test_compact_results_round_trip(tmp_path, prices_file):
+    full = Backtester(prices_file, MomentumStrategy(2), commission=0.001).run()
+
+    bt = Backtester(prices_file, MomentumStrategy(2), commission=0.001)
+    compact = bt.run(compact=True, float32=True)
+
+    assert compact["Signal"].dtype == np.int8
+    assert compact["Net_Returns"].dtype == np.float32
+    assert "Strategy_Returns" not in compact.columns
+    np.testing.assert_allclose(compact["Equity"], full["Equity"])
+
+    bt.save_results(tmp_path / "results.arrow")
+    loaded = Backtester.load_results(tmp_path / "results.arrow")
+    pd.testing.assert_frame_equal(loaded, compact.reset_index(drop=True))
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import mock_ohlc
+from src.features.feature_graph import FeatureGraph
+from src.indicators import atr, bollinger_bands, macd
+
+
+def test_shared_nodes_are_computed_once():
+    graph = FeatureGraph(mock_ohlc(120))
+    a = graph.macd("Close", 12, 26, 9)
+    b = graph.macd("Close", 12, 26, 5)
+    graph.output("macd_9", a[1])
+    graph.output("macd_5", b[1])
+    graph.output("ema_12", graph.ema("Close", 12))
+    graph.compute()
+
+    # ema12, ema26, macd line, two signal EMAs
+    assert graph.n_evaluated == 5
+
+
+def test_graph_outputs_match_indicators():
+    df = mock_ohlc(120)
+    graph = FeatureGraph(df)
+    for name, key in zip(["mid", "upper", "lower"], graph.bollinger_bands("Close", 20, 2)):
+        graph.output(name, key)
+    graph.output("macd", graph.macd("Close")[0])
+    graph.output("atr", graph.atr(window=14))
+    out = graph.compute()
+
+    mid, upper, lower = bollinger_bands(df["Close"], 20, 2)
+    np.testing.assert_allclose(out["upper"], upper)
+    np.testing.assert_allclose(out["macd"], macd(df["Close"])[0])
+    np.testing.assert_allclose(out["atr"], atr(df, 14))
+    assert not out["atr"].to_numpy().flags.writeable
+
+
+def ta_average_true_range(high, low, close, window):
+    """Reference: the recursion of ta.volatility.AverageTrueRange."""
+    prev_close = close.shift(1)
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+    out = np.full(len(close), np.nan)
+    out[window - 1] = tr.iloc[:window].mean()
+    for i in range(window, len(out)):
+        out[i] = (out[i - 1] * (window - 1) + tr.iloc[i]) / window
+    return out
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_wilder_atr_matches_ta(monkeypatch, use_numba):
+    from src import indicator_kernels as kernels
+
+    if not use_numba:
+        monkeypatch.setattr(kernels, "njit", None)
+    df = mock_ohlc(120)
+    graph = FeatureGraph(df)
+    graph.output("atr", graph.atr(window=14, smoothing="wilder"))
+    out = graph.compute()["atr"].to_numpy()
+
+    expected = ta_average_true_range(df["High"], df["Low"], df["Close"], 14)
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+
+def ta_rsi(close, window):
+    """Reference: ta.momentum.RSIIndicator(close, window).rsi()."""
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0)
+    down = -diff.where(diff < 0, 0.0)
+    emaup = up.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    emadn = down.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    return np.where(emadn == 0, 100, 100 - (100 / (1 + emaup / emadn)))
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_wilder_rsi_matches_ta(monkeypatch, use_numba):
+    from src import indicator_kernels as kernels
+
+    if not use_numba:
+        monkeypatch.setattr(kernels, "njit", None)
+    close = mock_ohlc(120)["Close"].copy()
+    close.iloc[40:45] = close.iloc[40]    # flat stretch: no losses
+    close.iloc[60] = np.nan
+    graph = FeatureGraph(pd.DataFrame({"Close": close}))
+    graph.output("rsi", graph.rsi(window=14, smoothing="wilder"))
+    out = graph.compute()["rsi"].to_numpy()
+
+    np.testing.assert_allclose(out, ta_rsi(close, 14), rtol=1e-12)
+
+
+def test_wilder_rsi_without_losses_is_100():
+    from src import indicator_kernels as kernels
+
+    rising = pd.Series(np.arange(1.0, 31.0))
+    out = kernels.wilder_rsi(rising, 14)
+    np.testing.assert_array_equal(out, ta_rsi(rising, 14))
+    assert np.isnan(out[:13]).all() and (out[13:] == 100).all()
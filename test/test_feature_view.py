@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.feature_view import FeatureView, signals_to_series, strategy_signals
+from src.indicators import sma
+
+
+def mock_price_df():
+    return pd.DataFrame({"Close": [10, 11, 12, 11, 10, 9, 10, 11, 12, 13.0]})
+
+
+class CrossStrategy:
+    def compute_signals(self, view):
+        fast, slow = view.sma("Close", 2), view.sma("Close", 4)
+        signal = (fast > slow).astype(np.float64)
+        signal[np.isnan(slow)] = np.nan
+        return signal
+
+    def generate_signals(self, df):
+        view = FeatureView(df)
+        return signals_to_series(self.compute_signals(view), view)
+
+
+def test_view_is_read_only_and_leaves_frame_untouched():
+    df = mock_price_df()
+    view = FeatureView(df)
+    with pytest.raises(ValueError):
+        view.column("Close")[0] = 0.0
+    with pytest.raises(ValueError):
+        view.sma("Close", 3)[-1] = 0.0
+    np.testing.assert_allclose(view.sma("Close", 3), sma(df["Close"], 3))
+    assert list(df.columns) == ["Close"]
+
+
+def test_adapter_matches_compute_signals():
+    df = mock_price_df()
+    strategy = CrossStrategy()
+    dense = strategy_signals(strategy, df)
+    series = strategy.generate_signals(df)
+
+    assert np.isnan(dense[:3]).all()
+    assert list(series.index) == list(range(3, 10))
+    np.testing.assert_array_equal(series.to_numpy(), dense[3:])
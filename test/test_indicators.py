@@ -24,3 +24,88 @@ def test_macd():
     s = pd.Series([1, 2, 3, 4, 5, 6, 7])
     dif, signal, hist = macd(s)
     assert len(dif) == len(signal) == len(hist)
+
+
+def test_indicator_cache_shares_results():
+    from src.indicator_cache import IndicatorCache, use_cache
+
+    s = pd.Series(range(100), dtype=float)
+    with use_cache(IndicatorCache()) as cache:
+        first = sma(s, 10)
+        again = sma(s.copy(), window=10)
+        macd(s)
+        ema(s, 12)
+
+    pd.testing.assert_series_equal(again, first)
+    assert cache.hits == 2
+    assert sma(s, 10) is not first
+
+
+def test_indicator_cache_isolates_callers():
+    from src.indicator_cache import IndicatorCache, use_cache
+
+    s = pd.Series(range(100), dtype=float)
+    with use_cache(IndicatorCache()) as cache:
+        first = sma(s, 10)
+        expected = first.copy()
+        first.iloc[50] = -1.0
+        pd.testing.assert_series_equal(sma(s, 10), expected)
+
+        # The input is hashed once per object, not once per lookup
+        calls = []
+        original = cache.fingerprint
+        cache.fingerprint = lambda *a: calls.append(a) or original(*a)
+        fresh = s * 2
+        for window in (5, 6, 7):
+            sma(fresh, window)
+        assert len(calls) == 1
+
+
+def test_multi_window_indicators_match_single():
+    import numpy as np
+    from src.indicators import bollinger_bands, roc, sma_multi, ema_multi, rsi_multi, bollinger_bands_multi, roc_multi
+
+    rng = np.random.default_rng(0)
+    s = pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, 300)))
+    windows = [2, 5, 20, 50]
+
+    np.testing.assert_allclose(sma_multi(s, windows), np.column_stack([sma(s, w) for w in windows]))
+    np.testing.assert_allclose(ema_multi(s, windows), np.column_stack([ema(s, w) for w in windows]))
+    np.testing.assert_allclose(rsi_multi(s, windows), np.column_stack([rsi(s, w) for w in windows]))
+    np.testing.assert_allclose(roc_multi(s, windows), np.column_stack([roc(s, w) for w in windows]))
+    for multi, single in zip(bollinger_bands_multi(s, windows), zip(*[bollinger_bands(s, w) for w in windows])):
+        np.testing.assert_allclose(multi, np.column_stack(single))
+
+
+def test_kernels_are_pandas_free_with_float32_option():
+    import numpy as np
+    from src import indicator_kernels as kernels
+
+    values = np.linspace(1, 50, 50)
+    out = kernels.sma(values, 5, dtype=np.float32)
+    assert isinstance(out, np.ndarray) and out.dtype == np.float32
+    np.testing.assert_allclose(out, sma(pd.Series(values), 5), rtol=1e-6)
+
+    k, d = kernels.stochastic(values + 1, values - 1, values, 14, 3, dtype=np.float32)
+    assert k.dtype == d.dtype == np.float32
+
+
+def test_rolling_std_is_stable_on_long_drifting_series(monkeypatch):
+    import numpy as np
+    from src import indicator_kernels as kernels
+
+    rng = np.random.default_rng(0)
+    values = 1000 + np.cumsum(rng.normal(0.01, 1, 300_000))
+    values[1000:1010] = np.nan
+
+    expected = pd.Series(values).rolling(20).std().to_numpy()
+    exact = np.full(len(values), np.nan)
+    exact[19:] = np.lib.stride_tricks.sliding_window_view(values, 20).std(axis=1, ddof=1)
+
+    out = kernels.rolling_std(values, 20)
+    np.testing.assert_allclose(out, exact, rtol=1e-9)
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    # No-numba fallback goes through pandas
+    monkeypatch.setattr(kernels, "njit", None)
+    np.testing.assert_allclose(kernels.rolling_std(values, 20), expected, rtol=1e-12)
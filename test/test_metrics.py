@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+from src.metrics import Metrics
+
+
+def make_metrics(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    returns = pd.Series(rng.normal(0.0005, 0.01, n))
+    equity = 100_000 * (1 + returns).cumprod()
+    return Metrics(returns, equity)
+
+
+def test_bootstrap_intervals_bracket_estimates():
+    table = make_metrics().bootstrap(n_resamples=500, block_size=10, chunk_size=128, seed=1)
+    assert list(table.columns) == ["Estimate", "Lower", "Upper"]
+    assert (table["Lower"] <= table["Upper"]).all()
+    assert table.loc["Sharpe Ratio", "Lower"] < table.loc["Sharpe Ratio", "Estimate"] < table.loc["Sharpe Ratio", "Upper"]
+
+
+def test_bootstrap_is_reproducible():
+    m = make_metrics()
+    a = m.bootstrap(n_resamples=200, seed=7)
+    b = m.bootstrap(n_resamples=200, chunk_size=64, seed=7)
+    pd.testing.assert_frame_equal(a, b)
+
+
+def test_compute_batch_matches_individual_metrics():
+    rng = np.random.default_rng(2)
+    returns = rng.normal(0.0005, 0.01, (250, 4))
+    returns[:3, 1] = np.nan
+    equity = 100_000 * np.cumprod(1 + np.nan_to_num(returns), axis=0)
+    equity[np.isnan(returns)] = np.nan
+
+    table = Metrics.compute_batch(returns, equity)
+    assert table.shape == (4, 12)
+
+    for j in range(4):
+        m = Metrics(pd.Series(returns[:, j]), pd.Series(equity[:, j]))
+        expected = {
+            "CAGR": m.cagr(),
+            "Volatility": m.volatility(),
+            "Sharpe Ratio": m.sharpe(),
+            "Sortino Ratio": m.sortino(),
+            "Max Drawdown": m.max_drawdown(),
+            "Calmar Ratio": m.calmar(),
+            "Win Rate": m.win_rate(),
+            "Profit Factor": m.profit_factor(),
+            "Expectancy": m.expectancy(),
+            "Average Win": m.average_win(),
+            "Average Loss": m.average_loss(),
+            "Payoff Ratio": m.payoff_ratio(),
+        }
+        row = table.iloc[j]
+        for name, value in expected.items():
+            np.testing.assert_allclose(row[name], value, rtol=1e-10, err_msg=f"{name} (series {j})")
+        assert m.compute_all() == {k: round(float(v), 6) for k, v in row.items()}
+
+
+def test_compute_all_known_values():
+    returns = pd.Series([0.1, -0.05, 0.02, -0.02])
+    equity = 100 * (1 + returns).cumprod()
+    metrics = Metrics(returns, equity, trading_days=4).compute_all()
+
+    assert metrics["Win Rate"] == 0.5
+    assert metrics["Profit Factor"] == round(0.12 / 0.07, 6)
+    assert metrics["Expectancy"] == 0.0125
+    assert metrics["Average Win"] == 0.06
+    assert metrics["Average Loss"] == -0.035
+    assert metrics["Payoff Ratio"] == round(0.06 / 0.035, 6)
+    assert metrics["Max Drawdown"] == round(1.1 * 0.95 * 1.02 * 0.98 / 1.1 - 1, 6)
+    assert metrics["Volatility"] == round(np.std([0.1, -0.05, 0.02, -0.02]) * 2, 6)
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src import indicator_kernels as kernels
+from src import indicators
+from src import panel_indicators as panel
+
+
+def mock_panel(n=300, m=4, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, (n, m)), axis=0)
+    close[:60, 1] = np.nan    # lists late
+    close[200:, 2] = np.nan   # delists early
+    spread = np.abs(rng.normal(0, 0.5, (n, m)))
+    cols = [f"A{j}" for j in range(m)]
+    return (
+        pd.DataFrame(close + spread, columns=cols),
+        pd.DataFrame(close - spread, columns=cols),
+        pd.DataFrame(close, columns=cols),
+    )
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_panel_matches_per_column_indicators(monkeypatch, use_numba):
+    if not use_numba:
+        # NumPy/pandas fallbacks, as when numba is not installed
+        monkeypatch.setattr(kernels, "njit", None)
+    high, low, close = mock_panel()
+    for j in range(close.shape[1]):
+        c = close.iloc[:, j]
+        ohlc = pd.DataFrame({"High": high.iloc[:, j], "Low": low.iloc[:, j], "Close": c})
+        listed = c.notna().to_numpy()
+
+        np.testing.assert_allclose(panel.sma(close, 20).iloc[:, j], indicators.sma(c, 20))
+        np.testing.assert_allclose(panel.rsi(close, 14).iloc[:, j], indicators.rsi(c, 14))
+        np.testing.assert_allclose(panel.roc(close, 10).iloc[:, j], indicators.roc(c, 10))
+        for p, k in zip(panel.bollinger_bands(close), indicators.bollinger_bands(c)):
+            np.testing.assert_allclose(p.iloc[:, j], k)
+        np.testing.assert_allclose(panel.atr(high, low, close).iloc[:, j], indicators.atr(ohlc))
+        for p, k in zip(panel.stochastic(high, low, close), indicators.stochastic(ohlc)):
+            np.testing.assert_allclose(p.iloc[:, j], k)
+
+        # Panel EMAs are NaN, not carried forward, where the price is missing
+        ema = panel.ema(close, 12).iloc[:, j].to_numpy()
+        assert np.isnan(ema[~listed]).all()
+        np.testing.assert_allclose(ema[listed], indicators.ema(c, 12)[listed])
+        if listed.all():
+            for p, k in zip(panel.macd(close), indicators.macd(c)):
+                np.testing.assert_allclose(p.iloc[:, j], k)
+
+
+def test_panel_signals_nan_outside_listing():
+    _, _, close = mock_panel()
+    signals = panel.sma_crossover_signals(close, 5, 20)
+    assert signals.iloc[:79, 1].isna().all() and signals.iloc[79:, 1].notna().all()
+    assert signals.iloc[200:, 2].isna().all()
+    assert panel.macd_signals(close).iloc[200:, 2].isna().all()
+    assert set(np.unique(signals.iloc[:, 0].dropna())) <= {0.0, 1.0}
+
+
+def test_panel_without_assets():
+    empty = pd.DataFrame(index=range(50), columns=pd.Index([], dtype=object), dtype=float)
+    assert panel.sma(empty, 20).shape == (50, 0)
+    assert all(band.shape == (50, 0) for band in panel.bollinger_bands(empty))
+    assert all(k.shape == (50, 0) for k in panel.stochastic(empty, empty, empty))
+    assert panel.macd_signals(empty).shape == (50, 0)
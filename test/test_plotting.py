@@ -0,0 +1,40 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+from src.plotting import Plotter, downsample, lttb_indices
+
+
+def mock_results(n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0002, 0.01, n)
+    returns[30_000] = -0.4   # one sharp crash
+    equity = 100_000 * np.cumprod(1 + returns)
+    return pd.DataFrame({"Net_Returns": returns, "Equity": equity})
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    y = np.sin(np.linspace(0, 20, 10_000))
+    y[4321] = 5.0
+    idx = lttb_indices(y, 200)
+    assert len(idx) == 200
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert 4321 in idx
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_downsampled_drawdown_keeps_max_drawdown_trough():
+    results = mock_results()
+    p = Plotter(results, max_points=500)
+    drawdown = p._drawdown()
+    sampled = downsample(drawdown, p.max_points, keep=p._trough(drawdown))
+
+    assert len(sampled) <= 502
+    assert sampled.min() == drawdown.min()
+    assert drawdown.idxmin() in sampled.index
+
+    p.plot_equity_curve()
+    p.plot_drawdown()
+    p.plot_rolling_sharpe()
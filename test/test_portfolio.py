@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from src.backtest.portfolio import PortfolioBacktester
+
+
+def mock_prices():
+    return pd.DataFrame({
+        "A": [10, 11, 12, 11, 10, 9, 10],
+        "B": [np.nan, np.nan, 20, 21, 22, 21, 20],   # lists late
+        "C": [5, 5.5, 6, np.nan, np.nan, np.nan, np.nan],  # delists
+    }, dtype=float)
+
+
+def test_portfolio_matches_hand_computed_pnl():
+    prices = mock_prices()
+    weights = pd.DataFrame(0.0, index=prices.index, columns=prices.columns)
+    weights.loc[0:1, "A"] = 1.0
+    weights.loc[2:, ["A", "B"]] = 0.5
+
+    bt = PortfolioBacktester(prices, commission=0.001, block_size=3)
+    results = bt.run(weights=weights)
+
+    returns = prices.pct_change(fill_method=None).fillna(0)
+    expected_gross = (weights.shift(1).fillna(0) * returns).sum(axis=1)
+    expected_turnover = weights.diff().abs().sum(axis=1)
+    expected_turnover.iloc[0] = weights.iloc[0].abs().sum()
+
+    np.testing.assert_allclose(results["Gross_Returns"], expected_gross)
+    np.testing.assert_allclose(results["Turnover"], expected_turnover)
+    np.testing.assert_allclose(bt.asset_returns.sum(axis=1), results["Gross_Returns"])
+    np.testing.assert_allclose(
+        results["Equity"], 100_000 * np.cumprod(1 + expected_gross - 0.001 * expected_turnover)
+    )
+
+
+def test_signals_are_equal_weighted_and_missing_is_flat():
+    prices = mock_prices()
+    signals = pd.DataFrame({"A": 1.0, "B": np.nan, "C": -1.0}, index=prices.index)
+    weights = PortfolioBacktester.signals_to_weights(signals)
+    np.testing.assert_allclose(weights.to_numpy(), np.tile([0.5, 0.0, -0.5], (7, 1)))
+
+    bt = PortfolioBacktester(prices)
+    bt.run(signals=signals)
+    assert set(bt.get_metrics()) >= {"Sharpe Ratio", "Max Drawdown"}
+
+
+def test_return_across_price_gap_is_realized():
+    prices = pd.DataFrame({"A": [10, 11, np.nan, np.nan, 13.2, 12, np.nan]})
+    weights = pd.DataFrame({"A": 1.0}, index=prices.index)
+
+    # Gap straddles a block boundary
+    results = PortfolioBacktester(prices, block_size=3).run(weights=weights)
+
+    expected = prices["A"].ffill().pct_change().fillna(0)
+    np.testing.assert_allclose(results["Gross_Returns"], expected)
+    assert results["Gross_Returns"].iloc[4] == 13.2 / 11 - 1
+    np.testing.assert_allclose(results["Equity"].iloc[-1], 100_000 * 12 / 10)
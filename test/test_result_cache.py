@@ -0,0 +1,127 @@
+import pandas as pd
+from conftest import MomentumStrategy, write_prices
+from src.backtest.backtest import Backtester
+from src.backtest.cache import ResultCache
+
+
+def test_cache_hit_skips_strategy(tmp_path):
+    file = tmp_path / "prices.csv"
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 11])
+    cache = ResultCache(tmp_path / "cache")
+
+    first = Backtester(file, MomentumStrategy(2), commission=0.001, cache=cache)
+    expected = first.run()
+    metrics = first.get_metrics()
+
+    strat = MomentumStrategy(2)
+    second = Backtester(file, strat, commission=0.001, cache=cache)
+    pd.testing.assert_frame_equal(second.run(), expected)
+    assert second.get_metrics() == metrics
+    assert not hasattr(strat, "calls")
+
+
+def test_cache_invalidates_on_data_change(tmp_path):
+    file = tmp_path / "prices.csv"
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 11])
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.key(Backtester(file, MomentumStrategy(2), cache=cache))
+
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 12])
+    assert cache.key(Backtester(file, MomentumStrategy(2), cache=cache)) != key
+    assert cache.key(Backtester(file, MomentumStrategy(3), cache=cache)) != key
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    file = tmp_path / "prices.csv"
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 11])
+    cache = ResultCache(tmp_path / "cache", max_bytes=0)
+    Backtester(file, MomentumStrategy(2), cache=cache).run()
+    assert cache.size() == 0
+
+
+class LinearModel:
+    def __init__(self, coef):
+        self.coef = coef
+
+    def predict(self, X):
+        return X @ self.coef
+
+
+def test_prediction_cache_keys_on_model_and_features(tmp_path):
+    import numpy as np
+    from src.backtest.cache import PredictionCache
+
+    cache = PredictionCache(tmp_path / "preds")
+    X = np.arange(12, dtype=float).reshape(6, 2)
+    fp = cache.model_fingerprint(LinearModel(np.array([1.0, 0.5])))
+
+    key = cache.chunk_key(fp, "predict", X)
+    assert cache.get_predictions(key) is None
+    cache.put_predictions(key, X @ np.array([1.0, 0.5]))
+    np.testing.assert_allclose(cache.get_predictions(cache.chunk_key(fp, "predict", X.copy())), X @ [1.0, 0.5])
+
+    refit = cache.model_fingerprint(LinearModel(np.array([1.0, 0.25])))
+    assert refit != fp
+    assert cache.chunk_key(refit, "predict", X) != key
+    assert cache.chunk_key(fp, "predict", X[:5]) != key
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+class ModelStrategy:
+    def __init__(self, model):
+        self.model = model
+
+    def generate_signals(self, df):
+        self.calls = getattr(self, "calls", 0) + 1
+        return (df["Close"].to_numpy() * self.model.coef[0] > 10.5).astype(int)
+
+
+def test_cache_misses_after_model_refit(tmp_path):
+    import numpy as np
+
+    file = tmp_path / "prices.csv"
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 11])
+    cache = ResultCache(tmp_path / "cache")
+    model = LinearModel(np.array([1.0]))
+    Backtester(file, ModelStrategy(model), cache=cache).run()
+
+    # Same object, same repr, new fitted state
+    model.coef = np.array([2.0])
+    strat = ModelStrategy(model)
+    Backtester(file, strat, cache=cache).run()
+    assert strat.calls == 1
+
+
+def test_unpicklable_params_are_not_cached(tmp_path):
+    file = tmp_path / "prices.csv"
+    write_prices(file, [10, 11, 12, 11, 10, 9, 10, 11])
+    cache = ResultCache(tmp_path / "cache")
+    strat = MomentumStrategy(2)
+    strat.hook = lambda x: x
+    assert cache.key(Backtester(file, strat, cache=cache)) is None
+
+    Backtester(file, strat, cache=cache).run()
+    Backtester(file, strat, cache=cache).run()
+    assert strat.calls == 2
+
+
+def test_prediction_cache_is_thread_safe(tmp_path):
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    from src.backtest.cache import PredictionCache
+
+    cache = PredictionCache(tmp_path / "preds", max_bytes=2_000)
+    raw = np.arange(50, dtype=float)
+
+    def worker(i):
+        key = f"k{i % 16}"
+        if cache.get_predictions(key) is None:
+            cache.put_predictions(key, raw)
+        cache.evict()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(400)))
+
+    assert cache.hits + cache.misses == 400
+    cache.evict()
+    assert cache.size() <= 2_000
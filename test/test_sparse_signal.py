@@ -0,0 +1,47 @@
+import numpy as np
+from conftest import FixedSignalStrategy
+from src.backtest.backtest import Backtester
+from src.backtest.sparse_signal import SparseSignal
+
+
+def test_run_sparse_matches_run(prices_file):
+    signals = np.array([np.nan, 0, 1, 1, 0, -1, -1, 1, 1])
+    bt = Backtester(prices_file, FixedSignalStrategy(signals), commission=0.001)
+    results = bt.run()
+
+    sparse = SparseSignal.from_dense(signals)
+    np.testing.assert_array_equal(sparse.starts, [0, 1, 2, 4, 5, 7])
+    np.testing.assert_array_equal(sparse.to_dense(), signals)
+
+    out = bt.run_sparse(sparse)
+    np.testing.assert_allclose(out["Equity"][2:], results["Equity"].to_numpy()[sparse.ends[2:] - 1])
+    np.testing.assert_allclose(out["Transaction_Cost"][2:], results["Transaction_Cost"].to_numpy()[sparse.starts[2:]])
+
+
+def test_run_sparse_tracks_replaced_data(prices_file):
+    signals = np.array([np.nan, 0, 0.37, 0.37, 0, -1, -1, 1, 1])
+    bt = Backtester(prices_file, FixedSignalStrategy(signals))
+    bt.load_data()
+    first = bt.run_sparse(signals)["Equity"]
+
+    # Same length, different returns: cached prefixes must not be reused
+    bt.data = bt.data.assign(Returns=bt.data["Returns"] * 2)
+    second = bt.run_sparse(signals)["Equity"]
+    assert not np.allclose(first[2:], second[2:])
+
+    fresh = Backtester(prices_file, FixedSignalStrategy(signals))
+    fresh.data = bt.data
+    np.testing.assert_allclose(second, fresh.run_sparse(signals)["Equity"])
+
+
+def test_run_sparse_log_growth_cache_is_bounded(prices_file):
+    bt = Backtester(prices_file, FixedSignalStrategy([]))
+    bt.load_data()
+    for size in np.linspace(0.1, 1, 3 * Backtester.LOG_GROWTH_ENTRIES):
+        bt.run_sparse(np.full(len(bt.data), size))
+    assert len(bt._log_growth) == Backtester.LOG_GROWTH_ENTRIES
+
+
+def test_sparse_signal_keeps_float64_sizes():
+    signals = np.array([np.nan, 0.1, 0.1, 1 / 3, -0.7])
+    np.testing.assert_array_equal(SparseSignal.from_dense(signals).to_dense(), signals)
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.feature_view import FeatureView
+from src.strategies.sma_strategy import SMAStrategy
+
+
+def mock_prices(n=600, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"Close": 100 * np.cumprod(1 + rng.normal(0, 0.01, n))})
+
+
+@pytest.mark.parametrize("allow_short", [False, True])
+def test_grid_signals_match_per_pair_strategies(allow_short):
+    df = mock_prices()
+    fast, slow = [3, 5, 10, 20], [5, 10, 20, 50]
+    signals, pairs = SMAStrategy.grid_signals(df, fast, slow, allow_short=allow_short)
+
+    assert pairs == [(f, s) for f in fast for s in slow if f < s]
+    assert signals.shape == (len(df), len(pairs))
+    for j, (f, s) in enumerate(pairs):
+        expected = (
+            SMAStrategy(f, s, allow_short=allow_short)
+            .generate_signals(df)
+            .reindex(df.index)
+            .fillna(0)
+            .to_numpy()
+        )
+        np.testing.assert_array_equal(signals[:, j], expected, err_msg=f"pair {(f, s)}")
+
+
+class CountingModel:
+    """Linear regressor that records the size of every predict() call."""
+
+    def __init__(self, coef):
+        self.coef = np.asarray(coef)
+        self.batch_sizes = []
+
+    def predict(self, X):
+        self.batch_sizes.append(len(X))
+        return X @ self.coef
+
+
+def mock_features(n=1003, seed=1):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"f1": rng.normal(0, 0.01, n), "f2": rng.normal(0, 0.01, n)})
+
+
+@pytest.mark.parametrize("n_jobs", [1, 4])
+def test_batched_ml_signals_match_unbatched_predict(n_jobs):
+    from src.strategies.ml_strategy import MLStrategy
+
+    df = mock_features()
+    model = CountingModel([1.0, -0.5])
+    strat = MLStrategy(model, ["f1", "f2"], batch_size=100, n_jobs=n_jobs)
+    signals = strat.generate_signals(df)
+
+    # 10 full batches and a final partial one of 3 rows
+    assert sorted(model.batch_sizes) == [3] + [100] * 10
+
+    raw = df[["f1", "f2"]].to_numpy() @ model.coef
+    expected = np.where(raw > 0.001, 1, np.where(raw < -0.001, -1, 0))
+    np.testing.assert_array_equal(signals.to_numpy(), expected)
+    pd.testing.assert_series_equal(
+        signals, MLStrategy(CountingModel([1.0, -0.5]), ["f1", "f2"], batch_size=None).generate_signals(df)
+    )
+
+
+def test_strategies_share_feature_graph_nodes():
+    from src.features.feature_graph import FeatureGraph
+    from src.strategies.macd_strategy import MACDStrategy
+    from src.strategies.rsi_strategy import RSIStrategy
+
+    df = mock_prices()
+    strategies = [SMAStrategy(10, 50), SMAStrategy(20, 50), RSIStrategy(14), MACDStrategy(12, 26, 9)]
+
+    graph = FeatureGraph(df)
+    for i, strategy in enumerate(strategies):
+        for name, key in strategy.declare_features(graph).items():
+            graph.output(f"{i}_{name}", key)
+    graph.output("sma_20", graph.sma("Close", 20))
+    graph.compute()
+    evaluated = graph.n_evaluated
+
+    # sma10, sma20, sma50, rsi14, ema12, ema26, macd line, signal, histogram
+    assert evaluated == 9
+    view = graph.view()
+    for strategy in strategies:
+        np.testing.assert_array_equal(strategy.compute_signals(view), strategy.compute_signals(FeatureView(df)))
+    assert graph.n_evaluated == evaluated
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+from conftest import FixedSignalStrategy
+from src.backtest.backtest import Backtester
+from src.backtest.streaming import StreamingBacktester
+
+
+def test_streaming_replay_matches_run(tmp_path):
+    prices = pd.DataFrame({"Close": [10, 11, 12, 11, 10, 9, 10, 11, 12, 13]})
+    file = tmp_path / "prices.csv"
+    prices.to_csv(file, index=False)
+    signals = [np.nan, np.nan, 1, 1, 0, -1, -1, 1, 1]
+
+    bt = Backtester(file, FixedSignalStrategy(signals), commission=0.001)
+    expected = bt.run()
+
+    stream = StreamingBacktester(commission=0.001)
+    replayed = stream.replay(prices.assign(Signal=[0] + signals))
+
+    cols = ["Strategy_Returns", "Transaction_Cost", "Net_Returns", "Equity"]
+    pd.testing.assert_frame_equal(replayed[cols], expected[cols], check_exact=True)
+
+
+def test_first_bar_only_sets_reference_price():
+    stream = StreamingBacktester()
+    assert stream.on_bar({"Close": 100.0, "Signal": 1}) is None
+    row = stream.on_bar({"Close": 101.0, "Signal": 1})
+    assert row["Strategy_Returns"] == 0.0
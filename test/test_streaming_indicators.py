@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import mock_ohlc
+from src import indicator_kernels as kernels
+from src.indicators import sma, ema, rsi, macd, bollinger_bands, atr, roc, stochastic
+from src.streaming_indicators import (
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingMeanStd,
+    StreamingBollinger,
+    StreamingATR,
+    StreamingROC,
+    StreamingStochastic,
+)
+
+
+def stream(indicator, *columns):
+    return np.array([indicator.update(*row) for row in zip(*columns)])
+
+
+def test_streaming_series_indicators_match_batch():
+    close = mock_ohlc()["Close"]
+    np.testing.assert_allclose(stream(StreamingSMA(20), close), sma(close, 20))
+    np.testing.assert_allclose(stream(StreamingEMA(12), close), ema(close, 12))
+    np.testing.assert_allclose(stream(StreamingRSI(14), close), rsi(close, 14))
+    np.testing.assert_allclose(stream(StreamingROC(10), close), roc(close, 10))
+    np.testing.assert_allclose(stream(StreamingMACD(), close), np.column_stack(macd(close)))
+    np.testing.assert_allclose(
+        stream(StreamingBollinger(20), close), np.column_stack(bollinger_bands(close, 20))
+    )
+
+
+def test_streaming_ohlc_indicators_match_batch():
+    df = mock_ohlc()
+    cols = (df["High"], df["Low"], df["Close"])
+    np.testing.assert_allclose(stream(StreamingATR(14), *cols), atr(df, 14))
+    np.testing.assert_allclose(
+        stream(StreamingStochastic(14, 3), *cols), np.column_stack(stochastic(df, 14, 3))
+    )
+
+
+def test_snapshot_restore_resumes_stream():
+    close = mock_ohlc()["Close"].to_numpy()
+    ind = StreamingRSI(14)
+    for x in close[:100]:
+        ind.update(x)
+    state = ind.snapshot()
+    tail = [ind.update(x) for x in close[100:]]
+
+    resumed = StreamingRSI(14).restore(state)
+    assert [resumed.update(x) for x in close[100:]] == tail
+
+
+def nan_gapped_ohlc(n=500):
+    df = mock_ohlc(n).copy()
+    df.loc[5, "Close"] = np.nan
+    df.loc[200:209, "Close"] = np.nan
+    df.loc[300, "High"] = np.nan
+    df.loc[350:353, "Low"] = np.nan
+    df.loc[420:421, ["High", "Low", "Close"]] = np.nan
+    return df
+
+
+@pytest.mark.parametrize(
+    "make, batch",
+    [
+        (lambda: StreamingSMA(20), lambda c: sma(c, 20)),
+        (lambda: StreamingEMA(12), lambda c: ema(c, 12)),
+        (lambda: StreamingRSI(14), lambda c: rsi(c, 14)),
+        (lambda: StreamingROC(10), lambda c: roc(c, 10)),
+        (lambda: StreamingMACD(), lambda c: np.column_stack(macd(c))),
+        (
+            lambda: StreamingMeanStd(20),
+            lambda c: np.column_stack([kernels.rolling_mean(c, 20), kernels.rolling_std(c, 20)]),
+        ),
+        (lambda: StreamingBollinger(20), lambda c: np.column_stack(bollinger_bands(c, 20))),
+    ],
+    ids=["sma", "ema", "rsi", "roc", "macd", "mean_std", "bollinger"],
+)
+def test_streaming_series_indicators_match_batch_across_nan_gaps(make, batch):
+    close = nan_gapped_ohlc()["Close"]
+    np.testing.assert_allclose(stream(make(), close), batch(close))
+
+
+@pytest.mark.parametrize(
+    "make, batch",
+    [
+        (lambda: StreamingATR(14), lambda df: atr(df, 14)),
+        (lambda: StreamingStochastic(14, 3), lambda df: np.column_stack(stochastic(df, 14, 3))),
+    ],
+    ids=["atr", "stochastic"],
+)
+def test_streaming_ohlc_indicators_match_batch_across_nan_gaps(make, batch):
+    df = nan_gapped_ohlc()
+    np.testing.assert_allclose(stream(make(), df["High"], df["Low"], df["Close"]), batch(df))
+
+
+def test_streaming_bollinger_does_not_drift():
+    rng = np.random.default_rng(1)
+    close = pd.Series(1e6 + np.cumsum(rng.normal(0, 1, 20_000)))
+    middle, upper, _ = stream(StreamingBollinger(20), close)[-1]
+    window = close.to_numpy()[-20:]
+    np.testing.assert_allclose(upper - middle, 2 * window.std(ddof=1), rtol=1e-9)
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+from src.metrics import Metrics
+from src.streaming_metrics import StreamingRiskTracker
+
+
+def mock_returns(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    returns = pd.Series(rng.normal(0.0005, 0.01, n))
+    returns.iloc[[0, 150]] = np.nan
+    equity = 100_000 * (1 + returns.fillna(0)).cumprod()
+    equity.iloc[[0, 150]] = np.nan
+    return returns, equity
+
+
+def test_streaming_risk_matches_metrics():
+    returns, equity = mock_returns()
+    tracker = StreamingRiskTracker(window=30)
+    rolling = np.array([tracker.update(r, e)["Rolling Sharpe"] for r, e in zip(returns, equity)])
+
+    m = Metrics(returns, equity)
+    np.testing.assert_allclose(rolling, m.rolling_sharpe(30), rtol=1e-9)
+    np.testing.assert_allclose(tracker.sharpe, m.sharpe(), rtol=1e-9)
+    np.testing.assert_allclose(tracker.sortino, m.sortino(), rtol=1e-9)
+    np.testing.assert_allclose(tracker.volatility, m.volatility(), rtol=1e-9)
+    np.testing.assert_allclose(tracker.max_drawdown, m.max_drawdown(), rtol=1e-12)
+
+
+def test_streaming_risk_compounds_equity_from_returns():
+    returns, _ = mock_returns(seed=1)
+    tracker = StreamingRiskTracker()
+    for r in returns:
+        tracker.update(r)
+
+    equity = (1 + returns.fillna(0)).cumprod()
+    dd = (equity - equity.cummax()) / equity.cummax()
+    np.testing.assert_allclose(tracker.drawdown, dd.iloc[-1])
+    np.testing.assert_allclose(tracker.max_drawdown, dd.min())
@@ -0,0 +1,16 @@
+from conftest import MomentumStrategy, write_prices
+from src.backtest.backtest import Backtester
+from src.backtest.sweep import ParameterSweep
+
+
+def test_parameter_sweep_matches_serial(tmp_path):
+    file = write_prices(tmp_path / "prices.csv", [10, 11, 12, 11, 10, 9, 10, 11, 12, 13, 12, 14])
+
+    sweep = ParameterSweep(file, MomentumStrategy, {"window": [1, 2, 3]}, commission=0.001, max_workers=2)
+    table = sweep.run()
+
+    assert list(table["window"]) == [1, 2, 3]
+    for _, row in table.iterrows():
+        bt = Backtester(file, MomentumStrategy(window=int(row["window"])), commission=0.001)
+        bt.run()
+        assert round(row["Sharpe Ratio"], 4) == round(bt.get_metrics()["Sharpe Ratio"], 4)
@@ -0,0 +1,24 @@
+import numpy as np
+from conftest import FixedSignalStrategy
+from src.backtest.backtest import Backtester
+
+
+def test_trade_ledger_segments_positions(prices_file):
+    signals = [np.nan, 0, 1, 1, 0, -1, -1, 1, 1]
+    bt = Backtester(prices_file, FixedSignalStrategy(signals), commission=0.001)
+    results = bt.run()
+    ledger = bt.trades()
+    close = results["Close"].to_numpy()
+
+    np.testing.assert_array_equal(ledger.entry, [2, 5, 7])
+    np.testing.assert_array_equal(ledger.exit, [4, 7, -1])
+    np.testing.assert_array_equal(ledger.side, [1, -1, 1])
+    np.testing.assert_array_equal(ledger.bars_held, [2, 2, 1])
+    returns = close[1:] / close[:-1] - 1
+    np.testing.assert_allclose(ledger.gross[0], close[4] / close[2] - 1)
+    np.testing.assert_allclose(ledger.gross[1], (1 - returns[5]) * (1 - returns[6]) - 1)
+    np.testing.assert_allclose(ledger.pnl[0], (close[4] / close[2]) * 0.999 ** 2 - 1)
+
+    stats = ledger.stats()
+    assert stats["Trades"] == 3
+    assert stats["Long Trades"] == 2 and stats["Short Trades"] == 1